@@ -1,7 +1,66 @@
-from src.orca.constants import OrcaConstants
-from src.orca.actuator import OrcaActuator
+import asyncio
+import functools
+import logging
+from typing import Tuple
 
-ORCA_CONSTANTS = OrcaConstants()
+from src.orca import constants
+from src.orca.actuator import KinematicMotion, OrcaActuator
+
+logger = logging.getLogger(__name__)
+
+# Kinematic status read retries before giving up on a motion update.
+KINEMATIC_STATUS_MAX_ATTEMPTS = 10
+KINEMATIC_STATUS_RETRY_INTERVAL_S = 0.01
+# Mode polling backoff and upper bound while waiting for a mode change.
+MODE_POLL_INITIAL_INTERVAL_S = 0.001
+MODE_POLL_MAX_INTERVAL_S = 0.02
+MODE_POLL_BACKOFF = 1.5
+MODE_WAIT_TIMEOUT_S = 30.0
+# Maps the active kinematic motion ID (0-3) to the
+# (motion_out_id, motion_in_id, motion_to_trigger_id) to configure next. Motions
+# [0, 1] and [2, 3] are used as alternating buffers.
+_MOTION_ROUTING = ((2, 3, 2), (2, 3, 3), (0, 1, 0), (0, 1, 1))
+
+
+@functools.lru_cache(maxsize=64)
+def _compute_motion_params(
+    stroke_rate_mm_s: float,
+    stroke_length_mm: float,
+    stroke_start_offset_mm: float,
+) -> Tuple[int, int, int]:
+    """
+    Computes the register values for a two-point kinematic motion.
+
+    Stroke settings change in fixed increments so the same combinations
+    recur constantly; results are memoized to skip the arithmetic on repeats.
+
+    Returns:
+        Tuple[int, int, int]: The settling time in milliseconds, the start
+        position target in micrometers and the end position target in
+        micrometers.
+    """
+    if (
+        isinstance(stroke_rate_mm_s, int)
+        and isinstance(stroke_length_mm, int)
+        and isinstance(stroke_start_offset_mm, int)
+    ):
+        # Integer inputs (the common case from the UI increments) can be
+        # scaled exactly without any floating point division or rounding.
+        settling_time_ms: int = max((stroke_length_mm * 1000) // stroke_rate_mm_s, 0)
+        position_target_start_um: int = max(stroke_start_offset_mm * 1000, 0)
+        position_target_end_um: int = max(
+            (stroke_length_mm + stroke_start_offset_mm) * 1000, 0
+        )
+        return settling_time_ms, position_target_start_um, position_target_end_um
+    # Calculate settling time in milliseconds for the given stroke rate.
+    settling_time_ms = max(int((stroke_length_mm / stroke_rate_mm_s) * 1000), 0)
+    # Calculate the start position target in micrometers.
+    position_target_start_um = max(int(stroke_start_offset_mm * 1000), 0)
+    # Calculate end position target in micrometers.
+    position_target_end_um = max(
+        int(stroke_length_mm * 1000 + stroke_start_offset_mm * 1000), 0
+    )
+    return settling_time_ms, position_target_start_um, position_target_end_um
 
 
 async def configure_two_point_kinematic_motion(
@@ -9,7 +68,7 @@ async def configure_two_point_kinematic_motion(
     stroke_rate_mm_s: float,
     stroke_length_mm: float,
     stroke_start_offset_mm: float = 0,
-) -> None:
+) -> bool:
     """
     Configures a two-point kinematic motion on the actuator to achieve the
     specified stroke rate and stroke length.
@@ -31,39 +90,39 @@ async def configure_two_point_kinematic_motion(
         stroke_length_mm (float): The desired stroke length in millimeters.
         stroke_start_offset_mm (float): The desired start position for the
             motion in millimeters (default: 0).
-        motion_id_1 (int): The ID of the first kinematic motion (default: 0).
-        motion_id_2 (int): The ID of the second kinematic motion (default: 1).
 
     Returns:
-        Union[bool, bool]: A tuple containing two boolean values.
-        The first value indicates if setting the first kinematic motion was
-        successful. The second value indicates if setting the second
-        kinematic motion was successful.
+        bool: True if both kinematic motions were set and triggered
+        successfully, False otherwise (including when the kinematic status
+        could not be read).
     """
-    # Calculate settling time in milliseconds for the given stroke rate.
-    settling_time_ms: int = max(int((stroke_length_mm / stroke_rate_mm_s) * 1000), 0)
-    # Calculate the start position target in micrometers.
-    position_target_start_um: int = max(int(stroke_start_offset_mm * 1000), 0)
-    # Calculate end position target in micrometers.
-    position_target_end_um: int = max(
-        int(stroke_length_mm * 1000 + stroke_start_offset_mm * 1000), 0
-    )
-    # Configure registers and trigger configured motion.
-    while True:
-        kin_status = await actuator.motor_read_stream(
-            ORCA_CONSTANTS.KINEMATIC_STATUS, register_width=1
+    settling_time_ms, position_target_start_um, position_target_end_um = (
+        _compute_motion_params(
+            stroke_rate_mm_s, stroke_length_mm, stroke_start_offset_mm
         )
+    )
+    # Read the active motion, backing off between attempts so the event loop
+    # (and the serial link) are not monopolized while the actuator is busy.
+    kin_status = None
+    for attempt in range(KINEMATIC_STATUS_MAX_ATTEMPTS):
+        kin_status = await actuator.motor_read_u16(constants.KINEMATIC_STATUS)
         if kin_status:
-            active_motion_id = kin_status.register_value & 0x7FFF
-            motion_out_id = 0
-            motion_in_id = 1
-            if active_motion_id == 0 or active_motion_id == 1:
-                motion_out_id = 2
-                motion_in_id = 3
-            motion_to_trigger_id = motion_out_id
-            if active_motion_id == 1 or active_motion_id == 3:
-                motion_to_trigger_id = motion_in_id
-            set_motion_out_successful = await actuator.set_kinematic_motion(
+            break
+        if attempt + 1 < KINEMATIC_STATUS_MAX_ATTEMPTS:
+            await asyncio.sleep(KINEMATIC_STATUS_RETRY_INTERVAL_S)
+    if not kin_status:
+        logger.error("Failed to read kinematic status.")
+        return False
+    # Configure registers and trigger configured motion.
+    active_motion_id = kin_status.register_value & 0x7FFF
+    motion_out_id, motion_in_id, motion_to_trigger_id = _MOTION_ROUTING[
+        active_motion_id & 0x3
+    ]
+    # The out and in motions use adjacent IDs, so both are written in one
+    # Modbus transaction.
+    set_motions_successful = await actuator.set_kinematic_motion_batch(
+        [
+            KinematicMotion(
                 motion_id=motion_out_id,
                 position_target_um=position_target_end_um,
                 settling_time_ms=settling_time_ms,
@@ -71,9 +130,8 @@ async def configure_two_point_kinematic_motion(
                 next_id=motion_in_id,
                 motion_type=1,  # Min jerk.
                 auto_start_next=1,
-            )
-            print(f"Set motion out to motion_id {motion_out_id}")
-            set_motion_in_successful = await actuator.set_kinematic_motion(
+            ),
+            KinematicMotion(
                 motion_id=motion_in_id,
                 position_target_um=position_target_start_um,
                 settling_time_ms=settling_time_ms,
@@ -81,23 +139,81 @@ async def configure_two_point_kinematic_motion(
                 next_id=motion_out_id,
                 motion_type=1,  # Min jerk.
                 auto_start_next=1,
+            ),
+        ]
+    )
+    logger.debug("Set motion out to motion_id %s", motion_out_id)
+    logger.debug("Set motion in to motion_id %s", motion_in_id)
+    logger.debug("Sets successful = %s", set_motions_successful)
+    logger.debug(
+        "Active motion id %s triggering just set motion id %s",
+        active_motion_id,
+        motion_to_trigger_id,
+    )
+    trigger_successful = await actuator.trigger_kinematic_motion(motion_to_trigger_id)
+    return set_motions_successful and trigger_successful
+
+
+async def wait_while_in_mode(
+    actuator: OrcaActuator,
+    mode: int,
+    max_poll_interval_s: float = MODE_POLL_MAX_INTERVAL_S,
+    timeout_s: float = MODE_WAIT_TIMEOUT_S,
+) -> bool:
+    """
+    Waits until the actuator leaves the given mode.
+
+    The mode is polled with the motor read stream, which also reports the
+    force and temperature in the same frame. The delay between polls backs
+    off up to max_poll_interval_s seconds so the serial link and event loop
+    remain available to other tasks.
+
+    Args:
+        actuator (OrcaActuator): The OrcaActuator object representing the
+            actuator.
+        mode (int): The mode to wait on.
+        max_poll_interval_s (float): The largest delay between mode reads in
+            seconds (default: 0.02).
+        timeout_s (float): The maximum time to wait in seconds (default: 30).
+
+    Returns:
+        bool: True if the actuator left the mode, False if the mode could not
+        be read or the actuator was still in the mode after timeout_s seconds.
+    """
+
+    async def poll_until_mode_exit() -> bool:
+        poll_interval_s: float = MODE_POLL_INITIAL_INTERVAL_S
+        while True:
+            result = await actuator.motor_read_u16(constants.MODE_OF_OPERATION)
+            if result is None:
+                logger.error("Failed to read actuator mode.")
+                return False
+            if result.register_value != mode:
+                return True
+            logger.debug(
+                "Waiting in mode %s, force %smN, temperature %sC",
+                mode,
+                result.force_mN,
+                result.temperature_C,
             )
-            print(f"Set motion in to motion_id {motion_out_id}")
-            print(
-                f"Sets successful = {set_motion_out_successful and set_motion_in_successful}"
-            )
-            print(
-                f"Active motion id {active_motion_id} triggering just set motion id {motion_to_trigger_id}"
+            await asyncio.sleep(poll_interval_s)
+            poll_interval_s = min(
+                poll_interval_s * MODE_POLL_BACKOFF, max_poll_interval_s
             )
-            await actuator.trigger_kinematic_motion(motion_to_trigger_id)
-            break
-    return
+
+    try:
+        return await asyncio.wait_for(poll_until_mode_exit(), timeout=timeout_s)
+    except asyncio.TimeoutError:
+        logger.error("Actuator did not leave mode %s within %ss.", mode, timeout_s)
+        return False
 
 
 async def auto_zero_wait(
     actuator: OrcaActuator,
     max_force_n: int = 50,
-    exit_to_mode: int = ORCA_CONSTANTS.MODE_SLEEP,
+    exit_to_mode: int = constants.MODE_SLEEP,
+    max_poll_interval_s: float = MODE_POLL_MAX_INTERVAL_S,
+    timeout_s: float = MODE_WAIT_TIMEOUT_S,
 ) -> bool:
     """
     Auto-zeros the actuator and waits until the actuator exits auto-zero mode.
@@ -108,7 +224,10 @@ async def auto_zero_wait(
         max_force_n (int): The maximum allowable force while auto-zeroing in
             newtons.
         exit_to_mode (int): The mode to exit to once auto-zeroing is complete.
-
+        max_poll_interval_s (float): The largest delay between mode reads in
+            seconds (default: 0.02).
+        timeout_s (float): The maximum time to wait for auto-zero to complete
+            in seconds (default: 30).
 
     Returns:
         bool: True if auto-zero was successful and the actuator exited
@@ -119,14 +238,11 @@ async def auto_zero_wait(
         exit_to_mode=exit_to_mode,
     )
     if not initiate_auto_zero_successful:
-        print("Failed to initiate auto-zero.")
+        logger.error("Failed to initiate auto-zero.")
         return False
-
-    while True:
-        mode = await actuator.get_mode()
-        if mode is None:
-            print("Failed to read actuator mode.")
-            return False
-        if mode != ORCA_CONSTANTS.MODE_AUTO_ZERO:
-            break
-    return True
+    return await wait_while_in_mode(
+        actuator,
+        constants.MODE_AUTO_ZERO,
+        max_poll_interval_s=max_poll_interval_s,
+        timeout_s=timeout_s,
+    )
@@ -1,17 +1,19 @@
-from typing import Union, Tuple
+from dataclasses import dataclass
+from typing import Iterator, Union, Tuple
 import asyncio
-
-import pynput
+import atexit
+import enum
+import logging
+import os
+import sys
+import termios
+import tty
 
 from src.orca.actuator import OrcaActuator
-from src.orca.constants import OrcaConstants
+from src.orca import constants
 from src.bytemachine import lib_bytemachine
 
-ORCA_CONSTANTS = OrcaConstants()
-
-# Default values
-STROKE_LENGTH_MM = 0  # Starting stroke length
-STROKE_RATE_MM_S = 0  # Starting stroke rate
+logger = logging.getLogger(__name__)
 
 # Limits
 MIN_STROKE_LENGTH_MM = 20
@@ -24,11 +26,19 @@ STROKE_LENGTH_INCREMENT_MM = 20
 STROKE_RATE_INCREMENT_MM_S = 20
 
 
-def print_usage():
+@dataclass
+class StrokeState:
+    """The stroke settings requested for a single actuator."""
+
+    length_mm: int = 0  # Starting stroke length
+    rate_mm_s: int = 0  # Starting stroke rate
+
+
+def print_usage(state: StrokeState):
     """Prints current state and usage instructions"""
     print(
-        f"Current stroke length {STROKE_LENGTH_MM}mm, stroke rate "
-        f"{STROKE_RATE_MM_S}mm/s\n"
+        f"Current stroke length {state.length_mm}mm, stroke rate "
+        f"{state.rate_mm_s}mm/s\n"
         "  Usage:\n"
         "  - up-arrow: increase stroke rate\n"
         "  - down-arrow: decrease stroke rate\n"
@@ -38,38 +48,103 @@ def print_usage():
     )
 
 
-def get_keys_queue():
-    queue = asyncio.Queue()
-    loop = asyncio.get_event_loop()
+class Key(enum.Enum):
+    """Terminal byte sequences for the keys used to control the stroke."""
+
+    UP = b"\x1b[A"
+    DOWN = b"\x1b[B"
+    RIGHT = b"\x1b[C"
+    LEFT = b"\x1b[D"
+    ESC = b"\x1b"
+
+
+def parse_keys(data: bytes) -> Iterator[Union[Key, str]]:
+    """
+    Splits a chunk of raw terminal input into individual key presses.
+
+    Args:
+        data (bytes): The bytes read from the terminal, which may contain
+            several key presses when keys are pressed in quick succession.
+
+    Returns:
+        Iterator[Union[Key, str]]: A Key for each recognized key and the
+        decoded character or escape sequence for any other input.
+    """
+    index = 0
+    while index < len(data):
+        if data[index : index + 1] != Key.ESC.value:
+            yield chr(data[index])
+            index += 1
+            continue
+        end = index + 1
+        introducer = data[end : end + 1]
+        if introducer == b"[":
+            # CSI sequences (arrows, Home, PgUp, ...) run up to a final byte in
+            # the range 0x40-0x7E.
+            end += 1
+            while end < len(data) and not 0x40 <= data[end] <= 0x7E:
+                end += 1
+            end += 1
+        elif introducer == b"O":
+            # SS3 sequences (F1-F4, keypad) have a single final byte.
+            end += 2
+        elif introducer:
+            # Alt+key sends escape followed by the key.
+            end += 1
+        sequence = data[index:end]
+        index = end
+        try:
+            yield Key(sequence)
+        except ValueError:
+            yield sequence.decode(errors="replace")
 
-    def on_press(
-        key: Union[pynput.keyboard.KeyCode, pynput.keyboard.Key, None]
-    ) -> None:
-        loop.call_soon_threadsafe(queue.put_nowait, key)
 
-    pynput.keyboard.Listener(on_press=on_press, suppress=True).start()
+def get_keys_queue():
+    queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+
+    # Deliver key presses without waiting for enter or echoing them, and put
+    # the terminal back the way it was on exit.
+    atexit.register(termios.tcsetattr, fd, termios.TCSADRAIN, termios.tcgetattr(fd))
+    tty.setcbreak(fd)
+
+    def on_readable() -> None:
+        data = os.read(fd, 32)
+        if not data:
+            # Stdin reached EOF or the terminal hung up. Stop watching it, since
+            # it would otherwise stay readable forever, and exit as if escape
+            # was pressed so the actuator is put to sleep.
+            loop.remove_reader(fd)
+            queue.put_nowait(Key.ESC)
+            return
+        for key in parse_keys(data):
+            queue.put_nowait(key)
+
+    # Read stdin directly on the event loop instead of from a listener thread.
+    loop.add_reader(fd, on_readable)
     return queue
 
 
 async def handle_state_change(
     actuator: OrcaActuator, stroke_rate_mm_s, stroke_length_mm
 ) -> Tuple[int, int]:
-    current_mode = await actuator.get_mode()
-    kinematic_status = await actuator.read_register(ORCA_CONSTANTS.KINEMATIC_STATUS)
-    if not kinematic_status:
+    mode_and_kinematic_status = await actuator.get_mode_and_kinematic_status()
+    if not mode_and_kinematic_status:
         return 0, 0
-    should_trigger_motion = not bool((kinematic_status[0] & 0x8000) >> 15)
+    current_mode, kinematic_status = mode_and_kinematic_status
+    should_trigger_motion = not bool((kinematic_status & 0x8000) >> 15)
     success = True
     if current_mode:
         if (
             stroke_length_mm == 0 or stroke_rate_mm_s == 0
-        ) and current_mode != ORCA_CONSTANTS.MODE_SLEEP:
-            success = await actuator.set_mode(ORCA_CONSTANTS.MODE_SLEEP) and success
+        ) and current_mode != constants.MODE_SLEEP:
+            success = (await actuator.sleep() is not None) and success
             should_trigger_motion = False
         if (
             stroke_length_mm > 0 or stroke_rate_mm_s > 0
-        ) and current_mode != ORCA_CONSTANTS.MODE_KINEMATIC:
-            success = await actuator.set_mode(ORCA_CONSTANTS.MODE_KINEMATIC) and success
+        ) and current_mode != constants.MODE_KINEMATIC:
+            success = await actuator.set_mode(constants.MODE_KINEMATIC) and success
     result_stroke_rate_mm_s = max(stroke_rate_mm_s, MIN_STROKE_RATE_MM_S)
     result_stroke_length_mm = max(stroke_length_mm, MIN_STROKE_LENGTH_MM)
     success = (
@@ -92,85 +167,88 @@ async def main():
     actuator = OrcaActuator(port="/dev/tty.usbserial-FT8F0SP7")
     connected = await actuator.connect()
     if not connected:
-        print("Failed to connect to the actuator. Exiting.")
+        logger.error("Failed to connect to the actuator. Exiting.")
         return
 
-    await actuator.set_mode(ORCA_CONSTANTS.MODE_SLEEP)
+    await actuator.sleep()
     await actuator.reset_kinematic_config()
     await actuator.reset_user_options()
 
     # Perform auto-zero before starting
-    print("Performing auto-zero...")
+    logger.info("Performing auto-zero...")
     auto_zero_success = await lib_bytemachine.auto_zero_wait(actuator)
     if not auto_zero_success:
-        print("Auto-zero failed. Exiting.")
+        logger.error("Auto-zero failed. Exiting.")
         return
-    print("Auto-zero complete.")
+    logger.info("Auto-zero complete.")
 
     # Configure max force.
     await actuator.set_max_force(35585)
 
-    async def handle_key(
-        key: Union[pynput.keyboard.KeyCode, pynput.keyboard.Key, None]
-    ) -> bool:
+    state = StrokeState()
+
+    def handle_key(key: Union[Key, str]) -> bool:
         """Handles key presses for adjusting stroke length and speed."""
-        global STROKE_LENGTH_MM, STROKE_RATE_MM_S
-        changed: bool = False
-        try:
-            if key == pynput.keyboard.Key.left:
-                STROKE_LENGTH_MM = max(
-                    STROKE_LENGTH_MM - STROKE_LENGTH_INCREMENT_MM,
-                    MIN_STROKE_LENGTH_MM,
-                )
-                changed = True
-            elif key == pynput.keyboard.Key.right:
-                STROKE_LENGTH_MM = min(
-                    STROKE_LENGTH_MM + STROKE_LENGTH_INCREMENT_MM,
-                    MAX_STROKE_LENGTH_MM,
-                )
-                changed = True
-            elif key == pynput.keyboard.Key.up:
-                STROKE_RATE_MM_S = min(
-                    STROKE_RATE_MM_S + STROKE_RATE_INCREMENT_MM_S,
-                    MAX_STROKE_RATE_MM_S,
-                )
-                changed = True
-            elif key == pynput.keyboard.Key.down:
-                STROKE_RATE_MM_S = max(
-                    STROKE_RATE_MM_S - STROKE_RATE_INCREMENT_MM_S,
-                    MIN_STROKE_RATE_MM_S,
-                )
-                changed = True
-            elif key == pynput.keyboard.Key.esc:
-                return True
-            else:
-                print(f"Unhandeled key pressed: {key}")
-
-            if changed:
-                handle_state_success = await handle_state_change(
-                    actuator, STROKE_RATE_MM_S, STROKE_LENGTH_MM
-                )
-                if not handle_state_success:
-                    return True
-                STROKE_RATE_MM_S = handle_state_success[0]
-                STROKE_LENGTH_MM = handle_state_success[1]
-                print_usage()
-
-        except AttributeError:
-            print(f"Special key pressed: {key}")
+        if key == Key.LEFT:
+            state.length_mm = max(
+                state.length_mm - STROKE_LENGTH_INCREMENT_MM,
+                MIN_STROKE_LENGTH_MM,
+            )
+        elif key == Key.RIGHT:
+            state.length_mm = min(
+                state.length_mm + STROKE_LENGTH_INCREMENT_MM,
+                MAX_STROKE_LENGTH_MM,
+            )
+        elif key == Key.UP:
+            state.rate_mm_s = min(
+                state.rate_mm_s + STROKE_RATE_INCREMENT_MM_S,
+                MAX_STROKE_RATE_MM_S,
+            )
+        elif key == Key.DOWN:
+            state.rate_mm_s = max(
+                state.rate_mm_s - STROKE_RATE_INCREMENT_MM_S,
+                MIN_STROKE_RATE_MM_S,
+            )
+        elif key == Key.ESC:
+            return True
+        else:
+            # Escape sequences are logged with repr so they are not
+            # interpreted by the terminal.
+            logger.info("Unhandled key pressed: %r", key)
+        return False
+
+    async def apply_state_change() -> bool:
+        """Applies the current stroke length and speed to the actuator."""
+        handle_state_success = await handle_state_change(
+            actuator, state.rate_mm_s, state.length_mm
+        )
+        if not handle_state_success:
+            return True
+        state.rate_mm_s, state.length_mm = handle_state_success
+        print_usage(state)
         return False
 
     # Print current state and usage instructions.
-    print_usage()
+    print_usage(state)
 
     while True:
         key = await key_queue.get()
-        should_exit = await handle_key(key)
+        previous_state: Tuple[int, int] = (state.rate_mm_s, state.length_mm)
+        should_exit = handle_key(key)
+        # Fold any key presses that queued up while the actuator was being
+        # reconfigured into a single reconfiguration targeting the latest state.
+        while not should_exit and not key_queue.empty():
+            should_exit = handle_key(key_queue.get_nowait())
+        # Key presses that clamp to the current limits leave the stroke
+        # unchanged, in which case the actuator needs no reconfiguration.
+        if not should_exit and (state.rate_mm_s, state.length_mm) != previous_state:
+            should_exit = await apply_state_change()
         if should_exit:
-            await actuator.set_mode(ORCA_CONSTANTS.MODE_SLEEP)
+            await actuator.sleep()
             break
     actuator.close()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
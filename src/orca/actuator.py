@@ -1,13 +1,19 @@
-from typing import Union
+import asyncio
+import functools
+import logging
+import math
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Sequence, Tuple, Union
 
-import numpy as np
 from pymodbus.client.serial import AsyncModbusSerialClient
-from pymodbus.exceptions import ModbusIOException
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 from pymodbus.framer import Framer
-from pymodbus.pdu import ModbusResponse
+from pymodbus.pdu import ModbusRequest, ModbusResponse
 
-from src.orca import bit_utils
-from src.orca.constants import OrcaConstants
+from src.orca import constants
 from src.orca.manage_high_speed_stream import (
     ManageHighSpeedStreamRequest,
     ManageHighSpeedStreamResponse,
@@ -29,7 +35,122 @@ from src.orca.motor_write_stream import (
     MotorWriteStreamResult,
 )
 
-ORCA_CONSTANTS = OrcaConstants()
+logger = logging.getLogger(__name__)
+
+# Number of holding registers occupied by a single kinematic motion.
+KIN_MOTION_REGISTER_COUNT: int = 6
+# Starting address of each kinematic motion (IDs 0-31), spring effect (IDs 0-2)
+# and oscillation effect (IDs 0-1), indexed by ID.
+_KIN_MOTION_ADDRESSES: Tuple[int, ...] = tuple(
+    constants.KIN_MOTION_0 + KIN_MOTION_REGISTER_COUNT * motion_id
+    for motion_id in range(32)
+)
+_SPRING_EFFECT_ADDRESSES: Tuple[int, ...] = tuple(
+    constants.S0_GAIN_N_MM + 6 * spring_id for spring_id in range(3)
+)
+_OSCILLATION_EFFECT_ADDRESSES: Tuple[int, ...] = tuple(
+    constants.O0_GAIN_N + 4 * oscillation_id for oscillation_id in range(2)
+)
+# Values the actuator accepts, checked before writing so invalid values are
+# rejected without a round-trip.
+_VALID_MODES: frozenset = frozenset(
+    (
+        constants.MODE_SLEEP,
+        constants.MODE_FORCE,
+        constants.MODE_POSITION,
+        constants.MODE_HAPTIC,
+        constants.MODE_KINEMATIC,
+        constants.MODE_AUTO_ZERO,
+    )
+)
+_VALID_SPRING_COUPLINGS: frozenset = frozenset(range(3))
+_VALID_WAVEFORM_TYPES: frozenset = frozenset(range(4))
+# Packs two int32 values and reads them back as four low/high uint16 words.
+_INT32_PAIR: struct.Struct = struct.Struct("<ii")
+_INT32_PAIR_AS_WORDS: struct.Struct = struct.Struct("<4H")
+# Modbus limits a single read holding registers request to 125 registers.
+MAX_READ_REGISTER_COUNT: int = 125
+# Modbus limits a single write multiple registers request to 123 registers.
+MAX_WRITE_REGISTER_COUNT: int = 123
+# The actuator identity (serial number and firmware version) never changes at
+# runtime, so reads lying entirely within these registers are cached for the
+# life of the OrcaActuator object and survive write invalidation.
+STATIC_REGISTERS: range = range(constants.SERIAL_NUMBER_LOW, constants.COMMIT_ID_HI + 1)
+
+
+@dataclass(kw_only=True)
+class KinematicMotion:
+    motion_id: int
+    position_target_um: int
+    settling_time_ms: int
+    auto_start_delay_ms: int
+    next_id: int
+    motion_type: int
+    auto_start_next: int
+
+
+@dataclass(kw_only=True)
+class StateSnapshot:
+    mode: int
+    kinematic_status: int
+    position_um: int
+
+
+@dataclass(kw_only=True)
+class StatusSnapshot:
+    mode: int
+    kinematic_status: int
+    position_um: int
+    force_mN: int
+    power_W: int
+    voltage_mV: int
+    stator_temperature_C: int
+    driver_temperature_C: int
+    coil_temperature_C: int
+
+
+@dataclass(kw_only=True)
+class ActuatorInfo:
+    serial_number: int
+    firmware_version: str
+    mode: int
+
+
+def _int32_from_words(low: int, high: int) -> int:
+    """Returns the signed 32 bit value stored in a low and high register."""
+    value: int = (high << 16) | low
+    return value - ((value & 0x80000000) << 1)
+
+
+def _merge_register_ranges(
+    ranges: List[Tuple[int, int]], max_gap: int
+) -> List[Tuple[int, int]]:
+    """
+    Merges register ranges that overlap or are at most max_gap apart.
+
+    Args:
+        ranges (List[Tuple[int, int]]): The (address, count) of each range.
+        max_gap (int): The largest number of unrequested registers allowed
+            between two merged ranges.
+
+    Returns:
+        List[Tuple[int, int]]: The (start, end) of each merged range, sorted by
+            address, with end exclusive and no merged range spanning more than
+            MAX_READ_REGISTER_COUNT registers unless a single range does.
+    """
+    merged_ranges: List[Tuple[int, int]] = []
+    for address, count in sorted(ranges):
+        if merged_ranges:
+            merged_start, merged_end = merged_ranges[-1]
+            end: int = max(merged_end, address + count)
+            if (
+                address <= merged_end + max_gap
+                and end - merged_start <= MAX_READ_REGISTER_COUNT
+            ):
+                merged_ranges[-1] = (merged_start, end)
+                continue
+        merged_ranges.append((address, address + count))
+    return merged_ranges
 
 
 class OrcaActuator:
@@ -55,25 +176,95 @@ class OrcaActuator:
         timeout_s (int): The timeout for Modbus requests in seconds (default: 1).
         stop_bits (int): The number of stop bits to use (default: 1).
         parity (str): The parity to use (default: "E" for even parity).
-        client (AsyncModbusSerialClient): The asynchronous Modbus serial client object.
+        client (AsyncModbusSerialClient): The asynchronous Modbus serial client
+            object, shared with any other actuator on the same port.
+        cache_ttl_ms (float): How long register reads are served from the
+            register cache in milliseconds, 0 disables caching (default: 5).
+        read_gap_tolerance (int): The largest number of unrequested registers
+            read in order to merge reads issued concurrently (default: 0).
     """
 
-    def __init__(self, port: str, timeout: int = 1):
+    # Instance attributes are fixed, so store them in slots rather than a
+    # per-instance dict.
+    __slots__ = (
+        "framer",
+        "port",
+        "slave_address",
+        "baudrate",
+        "timeout_s",
+        "stop_bits",
+        "parity",
+        "cache_ttl_ms",
+        "_cache",
+        "_cache_generation",
+        "read_gap_tolerance",
+        "_pending_reads",
+        "_read_flush_task",
+        "_kinematic_motions",
+        "client",
+        "_read_holding_registers",
+        "_write_register",
+        "_write_registers",
+        "_execute",
+        "_closed",
+    )
+
+    # Serial port to the shared client for that port and the number of open
+    # actuators using it.
+    _client_pool: Dict[str, AsyncModbusSerialClient] = {}
+    _client_ref_counts: Dict[str, int] = {}
+    _client_pool_lock: threading.Lock = threading.Lock()
+    # Responses to the Orca specific function codes, decoded by every client.
+    _RESPONSE_TYPES: Tuple[type, ...] = (
+        ManageHighSpeedStreamResponse,
+        MotorCommandStreamResponse,
+        MotorReadStreamResponse,
+        MotorWriteStreamResponse,
+    )
+
+    def __init__(
+        self,
+        port: str,
+        timeout: int = 1,
+        cache_ttl_ms: float = 5,
+        read_gap_tolerance: int = 0,
+        slave_address: int = 1,
+    ):
         """
         Initializes the OrcaActuator object.
 
         Args:
             port (str): The serial port the actuator is connected to.
             timeout_s (int): The timeout for Modbus requests in seconds (default: 1).
+            cache_ttl_ms (float): How long register reads are served from the
+                register cache in milliseconds, 0 disables caching (default: 5).
+            read_gap_tolerance (int): The largest number of unrequested
+                registers read to merge two concurrent reads (default: 0).
+            slave_address (int): The slave address of the actuator, which
+                must be unique among actuators sharing a port (default: 1).
         """
         self.framer: Framer = Framer.RTU
         self.port: str = port
-        self.slave_address: int = 1
+        # Fixed, since the client calls bound below capture it.
+        self.slave_address: Final[int] = slave_address
         self.baudrate: int = 19200
         self.timeout_s: int = timeout
         self.stop_bits: int = 1
         self.parity: str = "E"
-        self.client: AsyncModbusSerialClient = AsyncModbusSerialClient(
+        self.cache_ttl_ms: float = cache_ttl_ms
+        # Maps (address, count) to the monotonic read time in nanoseconds and
+        # the register values read.
+        self._cache: Dict[Tuple[int, int], Tuple[int, list]] = {}
+        # Bumped on every invalidation so reads in flight at the time do not
+        # cache values from before it.
+        self._cache_generation: int = 0
+        self.read_gap_tolerance: int = read_gap_tolerance
+        # Reads queued in the current event loop turn, flushed together.
+        self._pending_reads: List[Tuple[int, int, asyncio.Future]] = []
+        self._read_flush_task: Union[asyncio.Task, None] = None
+        # Maps kinematic motion IDs to the registers last written for them.
+        self._kinematic_motions: Dict[int, Tuple[int, ...]] = {}
+        self.client: AsyncModbusSerialClient = OrcaActuator._get_client(
             framer=self.framer,
             port=self.port,
             baudrate=self.baudrate,
@@ -81,20 +272,50 @@ class OrcaActuator:
             stopbits=self.stop_bits,
             timeout=self.timeout_s,
         )
-        # Orca actuators use a default interval of 2ms.
-        self.client.silent_interval = 0.002
-        self.client.register(
-            ManageHighSpeedStreamResponse  # pyright: ignore[reportArgumentType]
+        # Bind the client calls made on every transaction once, with the slave
+        # address applied, rather than resolving them on each call.
+        self._read_holding_registers = functools.partial(
+            self.client.read_holding_registers, slave=self.slave_address
         )
-        self.client.register(
-            MotorCommandStreamResponse  # pyright: ignore[reportArgumentType]
+        self._write_register = functools.partial(
+            self.client.write_register, slave=self.slave_address
         )
-        self.client.register(
-            MotorReadStreamResponse  # pyright: ignore[reportArgumentType]
-        )
-        self.client.register(
-            MotorWriteStreamResponse  # pyright: ignore[reportArgumentType]
+        self._write_registers = functools.partial(
+            self.client.write_registers, slave=self.slave_address
         )
+        self._execute = self.client.execute
+        # Set once this actuator has released its reference to the client.
+        self._closed: bool = False
+
+    @classmethod
+    def _get_client(cls, port: str, **kwargs) -> AsyncModbusSerialClient:
+        """
+        Returns the Modbus client for a serial port, creating it on first use.
+
+        Actuators created for the same port share one client so the port is
+        only opened and configured once. The settings of the first actuator
+        created for a port are used for its client.
+
+        Args:
+            port (str): The serial port the actuator is connected to.
+            **kwargs: The AsyncModbusSerialClient settings used if a new
+                client is created.
+
+        Returns:
+            AsyncModbusSerialClient: The client for the serial port.
+        """
+        with cls._client_pool_lock:
+            if port in cls._client_pool:
+                cls._client_ref_counts[port] += 1
+                return cls._client_pool[port]
+            client = AsyncModbusSerialClient(port=port, **kwargs)
+            # Orca actuators use a default interval of 2ms.
+            client.silent_interval = 0.002
+            for response_type in cls._RESPONSE_TYPES:
+                client.register(response_type)  # pyright: ignore[reportArgumentType]
+            cls._client_pool[port] = client
+            cls._client_ref_counts[port] = 1
+            return client
 
     async def connect(self) -> bool:
         """
@@ -103,9 +324,34 @@ class OrcaActuator:
         Returns:
             bool: True if connection was successful else False.
         """
+        if self.client.connected:
+            # The port is already open through another actuator.
+            return True
         connection_successful: bool = await self.client.connect()
+        if connection_successful:
+            self._enable_low_latency()
         return connection_successful
 
+    def _enable_low_latency(self) -> None:
+        """
+        Asks the serial driver to deliver received bytes immediately.
+
+        USB serial adapters (e.g. FTDI) otherwise hold received bytes for up
+        to 16ms before passing them on, adding that to every round-trip.
+        """
+        serial_port = getattr(self.client.transport, "sync_serial", None)
+        set_low_latency_mode = getattr(serial_port, "set_low_latency_mode", None)
+        if set_low_latency_mode is None:
+            return
+        try:
+            set_low_latency_mode(True)
+        except NotImplementedError:
+            # pyserial only supports ASYNC_LOW_LATENCY on Linux and raises on
+            # other POSIX platforms such as macOS.
+            logger.debug("Serial low latency mode is not supported here.")
+        except ValueError as e:
+            logger.warning("Failed to enable serial low latency mode: %s", e)
+
     async def get_serial_number(
         self,
     ) -> Union[int, None]:
@@ -116,12 +362,10 @@ class OrcaActuator:
             Union[int, None]: The actuator serial number, or None if reading failed.
         """
         read_result: Union[list, None] = await self.read_register(
-            ORCA_CONSTANTS.SERIAL_NUMBER_LOW, count=2
+            constants.SERIAL_NUMBER_LOW, count=2
         )
         if read_result:
-            return bit_utils.combine_low_high(
-                np.uint16(read_result[0]), np.uint16(read_result[1])
-            )
+            return (read_result[1] << 16) | read_result[0]
 
     async def get_firmware_version(self) -> Union[str, None]:
         """
@@ -131,11 +375,29 @@ class OrcaActuator:
             Union[str, None]: The firmware version string (e.g., "1.2.3"), or None if
                 reading failed.
         """
+        version: Union[Tuple[int, int, int], None] = (
+            await self.get_firmware_version_tuple()
+        )
+        if version:
+            return f"{version[0]}.{version[1]}.{version[2]}"
+
+    async def get_firmware_version_tuple(self) -> Union[Tuple[int, int, int], None]:
+        """
+        Returns the firmware version as integers, for comparing versions
+        without parsing the version string.
+
+        The version registers are cached for the lifetime of the actuator
+        object, so only the first call reads from the actuator.
+
+        Returns:
+            Union[Tuple[int, int, int], None]: The major, release and revision
+                numbers (e.g., (1, 2, 3)), or None if reading failed.
+        """
         read_result: Union[list, None] = await self.read_register(
-            ORCA_CONSTANTS.MAJOR_VERSION, count=3
+            constants.MAJOR_VERSION, count=3
         )
         if read_result:
-            return f"{read_result[0]}.{read_result[1]}.{read_result[2]}"
+            return read_result[0], read_result[1], read_result[2]
 
     async def set_mode(self, mode: int) -> bool:
         """
@@ -153,7 +415,24 @@ class OrcaActuator:
         Returns:
             bool: True if the mode was set successfully, False otherwise.
         """
-        return await self.write_register(ORCA_CONSTANTS.CTRL_REG_3, mode)
+        if mode not in _VALID_MODES:
+            logger.error("Invalid mode: %s", mode)
+            return False
+        return await self.write_register(constants.CTRL_REG_3, mode)
+
+    async def sleep(self) -> Union[MotorWriteStreamResult, None]:
+        """
+        Puts the actuator to sleep.
+
+        The mode is written with the motor write stream rather than a plain
+        register write, so the same transaction also reports the actuator
+        state.
+
+        Returns:
+            Union[MotorWriteStreamResult, None]: The actuator state reported
+                with the write, or None if the write failed.
+        """
+        return await self.motor_write_u16(constants.CTRL_REG_3, constants.MODE_SLEEP)
 
     async def get_mode(
         self,
@@ -165,11 +444,138 @@ class OrcaActuator:
             Union[int, None]: The current actuator mode, or None if reading failed.
         """
         read_result: Union[list, None] = await self.read_register(
-            ORCA_CONSTANTS.MODE_OF_OPERATION
+            constants.MODE_OF_OPERATION
         )
         if read_result:
             return read_result[0]
 
+    async def get_mode_and_kinematic_status(
+        self,
+    ) -> Union[Tuple[int, int], None]:
+        """
+        Get the current actuator mode and kinematic status in one Modbus read.
+
+        The mode and kinematic status registers are only two registers apart,
+        so a single read spanning both replaces two round-trips.
+
+        Returns:
+            Union[Tuple[int, int], None]: The current actuator mode and
+                kinematic status, or None if reading failed.
+        """
+        start_address: int = min(
+            constants.MODE_OF_OPERATION, constants.KINEMATIC_STATUS
+        )
+        end_address: int = max(constants.MODE_OF_OPERATION, constants.KINEMATIC_STATUS)
+        read_result: Union[list, None] = await self.read_register(
+            start_address, count=end_address - start_address + 1
+        )
+        if read_result:
+            return (
+                read_result[constants.MODE_OF_OPERATION - start_address],
+                read_result[constants.KINEMATIC_STATUS - start_address],
+            )
+
+    async def read_state_snapshot(self) -> Union[StateSnapshot, None]:
+        """
+        Get the current actuator mode, kinematic status and shaft position in
+        one Modbus read.
+
+        The registers all fall within a 27 register span, so reading them
+        together costs one round-trip instead of three.
+
+        Returns:
+            Union[StateSnapshot, None]: The current actuator state, or None if
+                reading failed.
+        """
+        start_address: int = min(
+            constants.MODE_OF_OPERATION,
+            constants.KINEMATIC_STATUS,
+            constants.SHAFT_POS_UM,
+        )
+        end_address: int = max(
+            constants.MODE_OF_OPERATION,
+            constants.KINEMATIC_STATUS,
+            constants.SHAFT_POSITION_H,
+        )
+        read_result: Union[list, None] = await self.read_register(
+            start_address, count=end_address - start_address + 1
+        )
+        if read_result:
+            return StateSnapshot(
+                mode=read_result[constants.MODE_OF_OPERATION - start_address],
+                kinematic_status=read_result[
+                    constants.KINEMATIC_STATUS - start_address
+                ],
+                position_um=_int32_from_words(
+                    read_result[constants.SHAFT_POS_UM - start_address],
+                    read_result[constants.SHAFT_POSITION_H - start_address],
+                ),
+            )
+
+    async def poll_status(self) -> Union[StatusSnapshot, None]:
+        """
+        Get the live actuator state, sensor readings and temperatures in one
+        Modbus read.
+
+        All of the registers fall within a 40 register span starting at the
+        mode register, so a single read replaces one round-trip per value.
+        Prefer read_state_snapshot when only the mode, kinematic status and
+        position are needed, as it transfers fewer registers.
+
+        Returns:
+            Union[StatusSnapshot, None]: The current actuator status, or None if
+                reading failed.
+        """
+        start_address: int = constants.MODE_OF_OPERATION
+        read_result: Union[list, None] = await self.read_register(
+            start_address, count=constants.COIL_TEMP - start_address + 1
+        )
+        if read_result:
+            return StatusSnapshot(
+                mode=read_result[constants.MODE_OF_OPERATION - start_address],
+                kinematic_status=read_result[
+                    constants.KINEMATIC_STATUS - start_address
+                ],
+                position_um=_int32_from_words(
+                    read_result[constants.SHAFT_POS_UM - start_address],
+                    read_result[constants.SHAFT_POSITION_H - start_address],
+                ),
+                force_mN=_int32_from_words(
+                    read_result[constants.FORCE - start_address],
+                    read_result[constants.FORCE_H - start_address],
+                ),
+                power_W=read_result[constants.POWER - start_address],
+                voltage_mV=read_result[constants.VDD_FINAL - start_address],
+                stator_temperature_C=read_result[constants.STATOR_TEMP - start_address],
+                driver_temperature_C=read_result[constants.DRIVER_TEMP - start_address],
+                coil_temperature_C=read_result[constants.COIL_TEMP - start_address],
+            )
+
+    async def get_actuator_info(self) -> Union[ActuatorInfo, None]:
+        """
+        Get the actuator serial number, firmware version and current mode.
+
+        The reads are issued concurrently so they are queued together, which
+        lets the adjacent serial number and firmware version registers be read
+        in a single transaction.
+
+        Returns:
+            Union[ActuatorInfo, None]: The actuator information, or None if any
+                read failed.
+        """
+        serial_number, firmware_version, mode = await asyncio.gather(
+            self.get_serial_number(),
+            self.get_firmware_version(),
+            self.get_mode(),
+        )
+        if serial_number is None or firmware_version is None or mode is None:
+            return None
+        return ActuatorInfo(
+            serial_number=serial_number,
+            firmware_version=firmware_version,
+            mode=mode,
+        )
+
     async def set_max_force(self, max_force_mn: int) -> bool:
         """
         Sets the user defined max force in millinewtons.
@@ -184,11 +590,10 @@ class OrcaActuator:
         Returns:
             bool: True if the max force was set successfully, False otherwise.
         """
-        max_force_int32 = np.int32(max_force_mn)
-        max_force_low = bit_utils.get_lsb(max_force_int32)
-        max_force_high = bit_utils.get_msb(max_force_int32)
+        max_force_low: int = max_force_mn & 0xFFFF
+        max_force_high: int = (max_force_mn >> 16) & 0xFFFF
         return await self.write_registers(
-            ORCA_CONSTANTS.USER_MAX_FORCE, [max_force_low, max_force_high]
+            constants.USER_MAX_FORCE, [max_force_low, max_force_high]
         )
 
     async def set_max_temp(self, max_temp_c: int) -> bool:
@@ -206,7 +611,7 @@ class OrcaActuator:
         Returns:
             bool: True if the max temp was set successfully, False otherwise.
         """
-        return await self.write_register(ORCA_CONSTANTS.USER_MAX_TEMP, max_temp_c)
+        return await self.write_register(constants.USER_MAX_TEMP, max_temp_c)
 
     async def set_max_power(self, max_power_w: int) -> bool:
         """
@@ -231,7 +636,7 @@ class OrcaActuator:
         Returns:
             bool: True if the max power was set successfully, False otherwise.
         """
-        return await self.write_register(ORCA_CONSTANTS.USER_MAX_POWER, max_power_w)
+        return await self.write_register(constants.USER_MAX_POWER, max_power_w)
 
     async def set_safety_damping(self, max_safety_damping: int) -> bool:
         """
@@ -244,21 +649,22 @@ class OrcaActuator:
         Returns:
             bool: True if the safety damping was set successfully, False otherwise.
         """
-        return await self.write_register(
-            ORCA_CONSTANTS.SAFETY_DGAIN, max_safety_damping
-        )
+        return await self.write_register(constants.SAFETY_DGAIN, max_safety_damping)
 
     async def trigger_kinematic_motion(self, motion_id: int) -> bool:
         """
         Trigger a kinematic motion.
 
         Args:
-            motion_id (int): The ID of the kinematic motion to trigger.
+            motion_id (int): The ID of the kinematic motion to trigger (0-31).
 
         Returns:
             bool: True if the motion was triggered successfully, False otherwise.
         """
-        return await self.write_register(ORCA_CONSTANTS.KIN_SW_TRIGGER, motion_id)
+        if not 0 <= motion_id < len(_KIN_MOTION_ADDRESSES):
+            logger.error("Invalid kinematic motion ID: %s", motion_id)
+            return False
+        return await self.write_register(constants.KIN_SW_TRIGGER, motion_id)
 
     async def full_reset(self) -> bool:
         """
@@ -268,7 +674,7 @@ class OrcaActuator:
             bool: True if the reset was successful, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_0, ORCA_CONSTANTS.CTRL_REG_0_FULL_RESET
+            constants.CTRL_REG_0, constants.CTRL_REG_0_FULL_RESET
         )
 
     async def clear_erros(self) -> bool:
@@ -279,7 +685,7 @@ class OrcaActuator:
             bool: True if the errors were cleared successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_0, ORCA_CONSTANTS.CTRL_REG_0_CLEAR_ERRORS
+            constants.CTRL_REG_0, constants.CTRL_REG_0_CLEAR_ERRORS
         )
 
     async def invert_position(self) -> bool:
@@ -290,7 +696,7 @@ class OrcaActuator:
             bool: True if the position inversion was successful, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_0, ORCA_CONSTANTS.CTRL_REG_0_INVERT_POSITION
+            constants.CTRL_REG_0, constants.CTRL_REG_0_INVERT_POSITION
         )
 
     async def save_params(self) -> bool:
@@ -301,7 +707,7 @@ class OrcaActuator:
             bool: True if the parameters were saved successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_2, ORCA_CONSTANTS.CTRL_REG_2_SAVE_PARAMS
+            constants.CTRL_REG_2, constants.CTRL_REG_2_SAVE_PARAMS
         )
 
     async def save_tuning(self) -> bool:
@@ -312,7 +718,7 @@ class OrcaActuator:
             bool: True if the tuning was saved successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_2, ORCA_CONSTANTS.CTRL_REG_2_SAVE_TUNING
+            constants.CTRL_REG_2, constants.CTRL_REG_2_SAVE_TUNING
         )
 
     async def save_user_options(self) -> bool:
@@ -323,7 +729,7 @@ class OrcaActuator:
             bool: True if the user options were saved successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_2, ORCA_CONSTANTS.CTRL_REG_2_SAVE_USER_OPTS
+            constants.CTRL_REG_2, constants.CTRL_REG_2_SAVE_USER_OPTS
         )
 
     async def save_kinematic_config(self) -> bool:
@@ -335,7 +741,7 @@ class OrcaActuator:
                 otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_2, ORCA_CONSTANTS.CTRL_REG_2_SAVE_KINEMATIC_CONFIG
+            constants.CTRL_REG_2, constants.CTRL_REG_2_SAVE_KINEMATIC_CONFIG
         )
 
     async def save_haptic_config(self) -> bool:
@@ -346,7 +752,7 @@ class OrcaActuator:
             bool: True if the haptic configuration was saved successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_2, ORCA_CONSTANTS.CTRL_REG_2_SAVE_HAPTIC_CONFIG
+            constants.CTRL_REG_2, constants.CTRL_REG_2_SAVE_HAPTIC_CONFIG
         )
 
     async def reset_params(self) -> bool:
@@ -357,7 +763,7 @@ class OrcaActuator:
             bool: True if the parameters were reset successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_4, ORCA_CONSTANTS.CTRL_REG_4_SET_DEFAULT_PARAMS
+            constants.CTRL_REG_4, constants.CTRL_REG_4_SET_DEFAULT_PARAMS
         )
 
     async def reset_tuning(self) -> bool:
@@ -368,7 +774,7 @@ class OrcaActuator:
             bool: True if the tuning was reset successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_4, ORCA_CONSTANTS.CTRL_REG_4_SET_DEFAULT_TUNING
+            constants.CTRL_REG_4, constants.CTRL_REG_4_SET_DEFAULT_TUNING
         )
 
     async def reset_user_options(self) -> bool:
@@ -378,16 +784,11 @@ class OrcaActuator:
         Returns:
             bool: True if the user options were reset successfully, False otherwise.
         """
-        write_successful: bool = await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_4,
-            ORCA_CONSTANTS.CTRL_REG_4_SET_DEFAULT_MOTOR_USER_OPTS,
-        )
-        return (
-            await self.write_register(
-                ORCA_CONSTANTS.CTRL_REG_4,
-                ORCA_CONSTANTS.CTRL_REG_4_SET_DEFAULT_MODBUS_USER_OPTS,
-            )
-            & write_successful
+        # CTRL_REG_4 is a bit field, so both resets are requested in one write.
+        return await self.write_register(
+            constants.CTRL_REG_4,
+            constants.CTRL_REG_4_SET_DEFAULT_MOTOR_USER_OPTS
+            | constants.CTRL_REG_4_SET_DEFAULT_MODBUS_USER_OPTS,
         )
 
     async def reset_kinematic_config(self) -> bool:
@@ -399,8 +800,8 @@ class OrcaActuator:
                 otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_4,
-            ORCA_CONSTANTS.CTRL_REG_4_SET_DEFAULT_KINEMATIC_CONFIG,
+            constants.CTRL_REG_4,
+            constants.CTRL_REG_4_SET_DEFAULT_KINEMATIC_CONFIG,
         )
 
     async def reset_haptic_config(self) -> bool:
@@ -411,8 +812,8 @@ class OrcaActuator:
             bool: True if the haptic configuration was reset successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_4,
-            ORCA_CONSTANTS.CTRL_REG_4_SET_DEFAULT_HAPTIC_CONFIG,
+            constants.CTRL_REG_4,
+            constants.CTRL_REG_4_SET_DEFAULT_HAPTIC_CONFIG,
         )
 
     async def zero_position(self) -> bool:
@@ -423,7 +824,7 @@ class OrcaActuator:
             bool: True if the position was zeroed successfully, False otherwise.
         """
         return await self.write_register(
-            ORCA_CONSTANTS.CTRL_REG_0, ORCA_CONSTANTS.CTRL_REG_0_ZERO_POSITION
+            constants.CTRL_REG_0, constants.CTRL_REG_0_ZERO_POSITION
         )
 
     async def command_auto_zero(self, max_force_n: int, exit_to_mode: int) -> bool:
@@ -438,16 +839,12 @@ class OrcaActuator:
         Returns:
             bool: True if auto-zero was initiated successfully, False otherwise.
         """
-        write_successful: bool = await self.write_registers(
-            ORCA_CONSTANTS.ZERO_MODE,
-            [ORCA_CONSTANTS.AUTO_ZERO_MODE_ENABLED, max_force_n, exit_to_mode],
-        )
-        return (
-            await self.write_register(
-                ORCA_CONSTANTS.CTRL_REG_3, ORCA_CONSTANTS.MODE_AUTO_ZERO
-            )
-            & write_successful
-        )
+        # Only enter auto-zero mode once it is configured, saving the mode
+        # write when the configuration write fails.
+        return await self.write_registers(
+            constants.ZERO_MODE,
+            [constants.AUTO_ZERO_MODE_ENABLED, max_force_n, exit_to_mode],
+        ) and await self.write_register(constants.CTRL_REG_3, constants.MODE_AUTO_ZERO)
 
     async def command_position(self, position_um: int) -> bool:
         """
@@ -459,11 +856,10 @@ class OrcaActuator:
         Returns:
             bool: True if the position command was sent successfully, False otherwise.
         """
-        position_int32 = np.int32(position_um)
-        position_low = bit_utils.get_lsb(position_int32)
-        position_high = bit_utils.get_msb(position_int32)
+        position_low: int = position_um & 0xFFFF
+        position_high: int = (position_um >> 16) & 0xFFFF
         return await self.write_registers(
-            ORCA_CONSTANTS.MOTOR_COMMAND_POS, [position_low, position_high]
+            constants.MOTOR_COMMAND_POS, [position_low, position_high]
         )
 
     async def command_force(self, force_mn: int) -> bool:
@@ -476,11 +872,10 @@ class OrcaActuator:
         Returns:
             bool: True if the force command was sent successfully, False otherwise.
         """
-        force_int32 = np.int32(force_mn)
-        force_low = bit_utils.get_lsb(force_int32)
-        force_high = bit_utils.get_msb(force_int32)
+        force_low: int = force_mn & 0xFFFF
+        force_high: int = (force_mn >> 16) & 0xFFFF
         return await self.write_registers(
-            ORCA_CONSTANTS.MOTOR_COMMAND_FORCE, [force_low, force_high]
+            constants.MOTOR_COMMAND_FORCE, [force_low, force_high]
         )
 
     async def set_kinematic_motion(
@@ -497,7 +892,7 @@ class OrcaActuator:
         Set a kinematic motion.
 
         Args:
-            motion_id (int): The ID of the kinematic motion to set.
+            motion_id (int): The ID of the kinematic motion to set (0-31).
             position_target_um (int): The target position for the motion in micrometers.
             settling_time_ms (int): The settling time for the motion in milliseconds.
             auto_start_delay_ms (int): The auto start delay for the motion in milliseconds.
@@ -508,24 +903,87 @@ class OrcaActuator:
         Returns:
             bool: True if the kinematic motion was set successfully, False otherwise.
         """
-        position_target_int32: np.int32 = np.int32(position_target_um)
-        position_target_low: int = bit_utils.get_lsb(position_target_int32)
-        position_target_high: int = bit_utils.get_msb(position_target_int32)
-        settling_time_int32: np.int32 = np.int32(settling_time_ms)
-        settling_time_low: int = bit_utils.get_lsb(settling_time_int32)
-        settling_time_high: int = bit_utils.get_msb(settling_time_int32)
-        next_type_auto: int = (motion_type << 1) | (next_id << 3) | auto_start_next
-        return await self.write_registers(
-            ORCA_CONSTANTS.KIN_MOTION_0 + 6 * motion_id,
+        return await self.set_kinematic_motion_batch(
             [
-                position_target_low,
-                position_target_high,
-                settling_time_low,
-                settling_time_high,
-                auto_start_delay_ms,
-                next_type_auto,
-            ],
+                KinematicMotion(
+                    motion_id=motion_id,
+                    position_target_um=position_target_um,
+                    settling_time_ms=settling_time_ms,
+                    auto_start_delay_ms=auto_start_delay_ms,
+                    next_id=next_id,
+                    motion_type=motion_type,
+                    auto_start_next=auto_start_next,
+                )
+            ]
+        )
+
+    async def set_kinematic_motion_batch(self, motions: List[KinematicMotion]) -> bool:
+        """
+        Set several kinematic motions using as few Modbus transactions as
+        possible.
+
+        Motions with consecutive IDs occupy adjacent register blocks, so each
+        run of consecutive IDs is written with a single write multiple
+        registers request instead of one request per motion. Motions the
+        actuator already holds, as last set through this object, are not
+        written again.
+
+        Args:
+            motions (List[KinematicMotion]): The kinematic motions to set.
+
+        Returns:
+            bool: True if all kinematic motions were set successfully, False
+                otherwise.
+        """
+        for motion in motions:
+            if not 0 <= motion.motion_id < len(_KIN_MOTION_ADDRESSES):
+                logger.error("Invalid kinematic motion ID: %s", motion.motion_id)
+                return False
+        writes: List[Tuple[int, Sequence[int]]] = []
+        written_motions: Dict[int, Tuple[int, ...]] = {}
+        for motion in motions:
+            registers: Tuple[int, ...] = self._kinematic_motion_registers(
+                position_target_um=motion.position_target_um,
+                settling_time_ms=motion.settling_time_ms,
+                auto_start_delay_ms=motion.auto_start_delay_ms,
+                next_id=motion.next_id,
+                motion_type=motion.motion_type,
+                auto_start_next=motion.auto_start_next,
+            )
+            if self._kinematic_motions.get(motion.motion_id) == registers:
+                continue
+            writes.append((_KIN_MOTION_ADDRESSES[motion.motion_id], registers))
+            written_motions[motion.motion_id] = registers
+        if not await self.write_registers_batched(writes):
+            return False
+        self._kinematic_motions.update(written_motions)
+        return True
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _kinematic_motion_registers(
+        position_target_um: int,
+        settling_time_ms: int,
+        auto_start_delay_ms: int,
+        next_id: int,
+        motion_type: int,
+        auto_start_next: int,
+    ) -> Tuple[int, ...]:
+        """
+        Returns the six register values describing a kinematic motion.
+
+        The same motions are set over and over as strokes are reconfigured, so
+        the packed values are memoized.
+        """
+        next_type_auto: int = (
+            ((next_id & 0x1F) << 3)
+            | ((motion_type & 0x3) << 1)
+            | (auto_start_next & 0x1)
         )
+        # Split both 32 bit values into little endian 16 bit words in one pass.
+        return _INT32_PAIR_AS_WORDS.unpack(
+            _INT32_PAIR.pack(position_target_um, settling_time_ms)
+        ) + (auto_start_delay_ms, next_type_auto)
 
     async def set_spring_effect(
         self,
@@ -540,7 +998,7 @@ class OrcaActuator:
         Set a spring effect.
 
         Args:
-            spring_id (int): The ID of the spring effect to set.
+            spring_id (int): The ID of the spring effect to set (0-2).
             gain_n_mm (int): Rate at which the force will increase proportional to
                 the change in position.
             center_um (int): The center position of the spring in micrometers.
@@ -554,15 +1012,20 @@ class OrcaActuator:
         Returns:
             bool: True if the spring effect was set successfully, False otherwise.
         """
-        gain_low: int = bit_utils.get_lsb(np.int32(gain_n_mm))
-        center_int32: np.int32 = np.int32(center_um)
-        center_low: int = bit_utils.get_lsb(center_int32)
-        center_high: int = bit_utils.get_msb(center_int32)
-        coupling_low: int = bit_utils.get_lsb(np.int32(coupling))
-        dead_zone_low: int = bit_utils.get_lsb(np.int32(dead_zone_mm))
-        saturation_low: int = bit_utils.get_lsb(np.int32(saturation_n))
+        if not 0 <= spring_id < len(_SPRING_EFFECT_ADDRESSES):
+            logger.error("Invalid spring effect ID: %s", spring_id)
+            return False
+        if coupling not in _VALID_SPRING_COUPLINGS:
+            logger.error("Invalid spring coupling: %s", coupling)
+            return False
+        gain_low: int = gain_n_mm & 0xFFFF
+        center_low: int = center_um & 0xFFFF
+        center_high: int = (center_um >> 16) & 0xFFFF
+        coupling_low: int = coupling & 0xFFFF
+        dead_zone_low: int = dead_zone_mm & 0xFFFF
+        saturation_low: int = saturation_n & 0xFFFF
         return await self.write_registers(
-            ORCA_CONSTANTS.S0_GAIN_N_MM + 6 * spring_id,
+            _SPRING_EFFECT_ADDRESSES[spring_id],
             [
                 gain_low,
                 center_low,
@@ -585,7 +1048,7 @@ class OrcaActuator:
         Set an oscillation effect.
 
         Args:
-            oscillation_id (int): The ID of the oscillation effect to set.
+            oscillation_id (int): The ID of the oscillation effect to set (0-1).
             amplitude_n (int): The amplitude of the oscillation in newtons.
             frequency_dhz (int): The frequency of the oscillation in decihertz.
             duty_percent (int): The duty cycle of the oscillation. This field
@@ -602,12 +1065,18 @@ class OrcaActuator:
         Returns:
             bool: True if the oscillation effect was set successfully, False otherwise.
         """
-        amplitude_low: int = bit_utils.get_lsb(np.int32(amplitude_n))
-        waveform_type_low: int = bit_utils.get_lsb(np.int32(waveform_type))
-        frequency_low: int = bit_utils.get_lsb(np.int32(frequency_dhz))
-        duty_low: int = bit_utils.get_lsb(np.int32(duty_percent))
+        if not 0 <= oscillation_id < len(_OSCILLATION_EFFECT_ADDRESSES):
+            logger.error("Invalid oscillation effect ID: %s", oscillation_id)
+            return False
+        if waveform_type not in _VALID_WAVEFORM_TYPES:
+            logger.error("Invalid oscillation waveform type: %s", waveform_type)
+            return False
+        amplitude_low: int = amplitude_n & 0xFFFF
+        waveform_type_low: int = waveform_type & 0xFFFF
+        frequency_low: int = frequency_dhz & 0xFFFF
+        duty_low: int = duty_percent & 0xFFFF
         return await self.write_registers(
-            ORCA_CONSTANTS.O0_GAIN_N + 4 * oscillation_id,
+            _OSCILLATION_EFFECT_ADDRESSES[oscillation_id],
             [
                 amplitude_low,
                 waveform_type_low,
@@ -641,21 +1110,16 @@ class OrcaActuator:
         Returns:
             bool: True if the position tuning was set successfully, False otherwise.
         """
-        proportional_gain_low: int = bit_utils.get_lsb(
-            np.int32(proportional_gain_mn_um)
-        )
-        integral_gain_low: int = bit_utils.get_lsb(np.int32(integral_gain_mns_um))
-        derivative_velocity_gain_low: int = bit_utils.get_lsb(
-            np.int32(derivative_velocity_gain_mnmm_s)
-        )
-        derivative_error_gain_low: int = bit_utils.get_lsb(
-            np.int32(derivative_error_gain_mnmm_s)
-        )
-        saturation_int32: np.int32 = np.int32(saturation_mn)
-        saturation_low: int = bit_utils.get_lsb(saturation_int32)
-        saturation_high: int = bit_utils.get_msb(saturation_int32)
-        write_successful: bool = await self.write_registers(
-            ORCA_CONSTANTS.PC_PGAIN,
+        proportional_gain_low: int = proportional_gain_mn_um & 0xFFFF
+        integral_gain_low: int = integral_gain_mns_um & 0xFFFF
+        derivative_velocity_gain_low: int = derivative_velocity_gain_mnmm_s & 0xFFFF
+        derivative_error_gain_low: int = derivative_error_gain_mnmm_s & 0xFFFF
+        saturation_low: int = saturation_mn & 0xFFFF
+        saturation_high: int = (saturation_mn >> 16) & 0xFFFF
+        # Only apply the gains once they have been written, saving the control
+        # register write when the gain write fails.
+        return await self.write_registers(
+            constants.PC_PGAIN,
             [
                 proportional_gain_low,
                 integral_gain_low,
@@ -664,13 +1128,9 @@ class OrcaActuator:
                 saturation_low,
                 saturation_high,
             ],
-        )
-        return (
-            await self.write_register(
-                ORCA_CONSTANTS.CTRL_REG_1,
-                ORCA_CONSTANTS.CTRL_REG_1_SET_POSITION_CONTROLLER_GAIN,
-            )
-            & write_successful
+        ) and await self.write_register(
+            constants.CTRL_REG_1,
+            constants.CTRL_REG_1_SET_POSITION_CONTROLLER_GAIN,
         )
 
     async def read_register(self, address: int, count: int = 1) -> Union[list, None]:
@@ -681,19 +1141,126 @@ class OrcaActuator:
             address (int): The starting address of the register(s) to read.
             count (int): The number of registers to read (default: 1).
 
+        Returns:
+            list: A list of register values, or None if the read failed.
+        """
+        now_ns: int = time.monotonic_ns()
+        cached = self._cache.get((address, count))
+        if (
+            cached
+            and now_ns - cached[0] < self._cache_ttl_ms(address, count) * 1_000_000
+        ):
+            return list(cached[1])
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending_reads.append((address, count, future))
+        if len(self._pending_reads) == 1:
+            # The first read queued flushes every read issued in the same event
+            # loop turn, merging adjacent ones into a single transaction.
+            self._read_flush_task = asyncio.create_task(
+                self._flush_pending_reads(now_ns)
+            )
+        return await future
+
+    async def _flush_pending_reads(self, now_ns: int) -> None:
+        """
+        Reads all queued register ranges, merging adjacent ranges.
+
+        Args:
+            now_ns (int): The monotonic time the reads were issued at in
+                nanoseconds, used to age cached values.
+        """
+        # Let reads issued in the same event loop turn join this batch.
+        await asyncio.sleep(0)
+        pending, self._pending_reads = self._pending_reads, []
+        cache_generation: int = self._cache_generation
+        try:
+            merged_ranges: List[Tuple[int, int]] = _merge_register_ranges(
+                [(address, count) for address, count, _ in pending],
+                self.read_gap_tolerance,
+            )
+            # Ranges split at the register cap can overlap, so each read goes
+            # to the first range that holds all of it, not just its start.
+            reads_by_range: List[List[Tuple[int, int, asyncio.Future]]] = [
+                [] for _ in merged_ranges
+            ]
+            for read in pending:
+                for index, (start, end) in enumerate(merged_ranges):
+                    if start <= read[0] and read[0] + read[1] <= end:
+                        reads_by_range[index].append(read)
+                        break
+            for (start, end), reads in zip(merged_ranges, reads_by_range):
+                if not reads:
+                    continue
+                registers: Union[list, None] = (
+                    await self._read_holding_registers_checked(start, end - start)
+                )
+                for address, count, future in reads:
+                    values: Union[list, None] = None
+                    if registers is not None:
+                        values = registers[address - start : address - start + count]
+                    elif len(reads) > 1:
+                        # Fall back to reading each range on its own so one
+                        # failing range does not fail the others.
+                        values = await self._read_holding_registers_checked(
+                            address, count
+                        )
+                    if (
+                        values is not None
+                        and self._cache_ttl_ms(address, count) > 0
+                        and self._cache_generation == cache_generation
+                    ):
+                        self._cache[(address, count)] = (now_ns, list(values))
+                    if not future.done():
+                        future.set_result(values)
+        except BaseException as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+
+    def _cache_ttl_ms(self, address: int, count: int) -> float:
+        """
+        Returns how long a read is served from the cache.
+
+        Args:
+            address (int): The starting address of the read.
+            count (int): The number of registers read.
+
+        Returns:
+            float: The cache lifetime in milliseconds, infinite for reads lying
+                entirely within STATIC_REGISTERS.
+        """
+        if (
+            address >= STATIC_REGISTERS.start
+            and address + count <= STATIC_REGISTERS.stop
+        ):
+            return math.inf
+        return self.cache_ttl_ms
+
+    async def _read_holding_registers_checked(
+        self, address: int, count: int
+    ) -> Union[list, None]:
+        """
+        Reads registers from the actuator in a single transaction.
+
+        Args:
+            address (int): The starting address of the register(s) to read.
+            count (int): The number of registers to read.
+
         Returns:
             list: A list of register values, or None if the read failed.
         """
         try:
-            response: ModbusResponse = await self.client.read_holding_registers(
-                address, count, slave=self.slave_address
+            response: ModbusResponse = await self._read_holding_registers(
+                address, count
             )
             if response.isError():
-                print(f"Error reading register(s): {response}")
+                logger.error("Error reading register(s): %s", response)
                 return None
             return response.registers
         except ModbusIOException as e:
-            print(f"Modbus IO Error: {e}")
+            logger.error("Modbus IO Error: %s", e)
             return None
 
     async def write_register(self, address: int, value: int) -> bool:
@@ -707,41 +1274,238 @@ class OrcaActuator:
         Returns:
             bool: True if the write was successful, False otherwise.
         """
+        # Writes act as commands (e.g. set_mode writes CTRL_REG_3 but changes
+        # MODE_OF_OPERATION), so no cached read can be trusted afterwards.
+        self.invalidate_cache()
+        self._forget_kinematic_motions(address, 1)
         try:
-            response: ModbusResponse = await self.client.write_register(
-                address, value, slave=self.slave_address
-            )
+            response: ModbusResponse = await self._write_register(address, value)
             if response.isError():
-                print(f"Error writing register: {response}")
+                logger.error("Error writing register: %s", response)
                 return False
             return True
         except ModbusIOException as e:
-            print(f"Modbus IO Error: {e}")
+            logger.error("Modbus IO Error: %s", e)
             return False
 
-    async def write_registers(self, address: int, values: list) -> bool:
+    async def write_registers(self, address: int, values: Sequence[int]) -> bool:
         """
         Writes multiple values to consecutive registers in the actuator.
 
         Args:
             address (int): The starting address of the registers to write to.
-            values (list): A list of values to write to the registers.
+            values (Sequence[int]): The values to write to the registers, such
+                as a list or tuple, which is sent without being copied.
 
         Returns:
             bool: True if the write was successful, False otherwise.
         """
+        # Writes act as commands (e.g. set_mode writes CTRL_REG_3 but changes
+        # MODE_OF_OPERATION), so no cached read can be trusted afterwards.
+        self.invalidate_cache()
+        self._forget_kinematic_motions(address, len(values))
         try:
-            response: ModbusResponse = await self.client.write_registers(
-                address, values, slave=self.slave_address
-            )
+            response: ModbusResponse = await self._write_registers(address, values)
             if response.isError():
-                print(f"Error writing registers: {response}")
+                logger.error("Error writing registers: %s", response)
                 return False
             return True
         except ModbusIOException as e:
-            print(f"Modbus IO Error: {e}")
+            logger.error("Modbus IO Error: %s", e)
             return False
 
+    async def read_many(
+        self, requests: List[Tuple[int, int]], max_gap: int = 4
+    ) -> List[Union[list, None]]:
+        """
+        Reads several register ranges using as few Modbus transactions as
+        possible, reporting failures per range.
+
+        Ranges that overlap or are separated by at most max_gap registers are
+        merged into a single read, since reading a few unused registers is
+        cheaper than the silent interval and turnaround of another frame.
+
+        Args:
+            requests (List[Tuple[int, int]]): The (address, count) of each
+                register range to read.
+            max_gap (int): The largest number of unrequested registers to read
+                in order to merge two ranges (default: 4).
+
+        Returns:
+            List[Union[list, None]]: The register values of each requested
+                range in the order requested, with None for each range whose
+                merged read failed.
+        """
+        merged_ranges: List[Tuple[int, int]] = _merge_register_ranges(requests, max_gap)
+        merged_values: List[Union[list, None]] = [
+            await self.read_register(start, count=end - start)
+            for start, end in merged_ranges
+        ]
+        results: List[Union[list, None]] = []
+        for address, count in requests:
+            for (start, end), values in zip(merged_ranges, merged_values):
+                if start <= address and address + count <= end:
+                    results.append(
+                        values[address - start : address - start + count]
+                        if values is not None
+                        else None
+                    )
+                    break
+        return results
+
+    async def read_register_map(
+        self, addresses: List[int], max_gap: int = 4
+    ) -> Dict[int, int]:
+        """
+        Reads scattered single registers using as few Modbus transactions as
+        possible.
+
+        Args:
+            addresses (List[int]): The addresses of the registers to read.
+            max_gap (int): The largest number of unrequested registers to read
+                in order to merge two reads (default: 4).
+
+        Returns:
+            Dict[int, int]: The value of each register read, keyed by address.
+                Registers whose merged read failed are omitted.
+        """
+        unique_addresses: List[int] = sorted(set(addresses))
+        results: List[Union[list, None]] = await self.read_many(
+            [(address, 1) for address in unique_addresses], max_gap
+        )
+        return {
+            address: values[0]
+            for address, values in zip(unique_addresses, results)
+            if values is not None
+        }
+
+    async def read_registers_batched(
+        self, requests: List[Tuple[int, int]], max_gap: int = 4
+    ) -> Union[List[list], None]:
+        """
+        Reads several register ranges using as few Modbus transactions as
+        possible, failing if any range cannot be read.
+
+        Args:
+            requests (List[Tuple[int, int]]): The (address, count) of each
+                register range to read.
+            max_gap (int): The largest number of unrequested registers to read
+                in order to merge two ranges (default: 4).
+
+        Returns:
+            Union[List[list], None]: The register values of each requested
+                range in the order requested, or None if any read failed.
+        """
+        results: List[Union[list, None]] = await self.read_many(requests, max_gap)
+        if any(values is None for values in results):
+            return None
+        return results  # pyright: ignore[reportReturnType]
+
+    async def write_registers_batched(
+        self, writes: List[Tuple[int, Sequence[int]]]
+    ) -> bool:
+        """
+        Writes several register ranges using as few Modbus transactions as
+        possible.
+
+        Only ranges that are strictly contiguous are merged, so no register
+        outside of the requested ranges is written. Ranges are written in
+        address order and are never split across transactions. A run of a
+        single register uses the shorter write single register request.
+
+        Args:
+            writes (List[Tuple[int, Sequence[int]]]): The starting address and
+                values of each register range to write.
+
+        Returns:
+            bool: True if all writes were successful, False otherwise.
+        """
+        runs: List[Tuple[int, List[int]]] = []
+        for address, values in sorted(writes, key=lambda write: write[0]):
+            if runs:
+                run_address, run_values = runs[-1]
+                if (
+                    address == run_address + len(run_values)
+                    and len(run_values) + len(values) <= MAX_WRITE_REGISTER_COUNT
+                ):
+                    # Extend the run in place rather than copying it for every
+                    # range.
+                    run_values.extend(values)
+                    continue
+            runs.append((address, list(values)))
+        for run_address, run_values in runs:
+            if len(run_values) == 1:
+                write_successful: bool = await self.write_register(
+                    run_address, run_values[0]
+                )
+            else:
+                write_successful = await self.write_registers(run_address, run_values)
+            if not write_successful:
+                return False
+        return True
+
+    async def write_many(self, values_by_address: Dict[int, int]) -> bool:
+        """
+        Writes scattered single registers using as few Modbus transactions as
+        possible.
+
+        Registers at consecutive addresses are written together with a single
+        write multiple registers request.
+
+        Args:
+            values_by_address (Dict[int, int]): The value to write to each
+                register, keyed by address.
+
+        Returns:
+            bool: True if all writes were successful, False otherwise.
+        """
+        return await self.write_registers_batched(
+            [(address, (value,)) for address, value in values_by_address.items()]
+        )
+
+    def invalidate_cache(
+        self, address: Union[int, None] = None, count: int = 1
+    ) -> None:
+        """
+        Drops cached register reads so the next read goes to the actuator.
+
+        Args:
+            address (Union[int, None]): The starting address of the registers
+                that changed, or None to drop every cached read apart from the
+                static ones in STATIC_REGISTERS (default: None).
+            count (int): The number of registers that changed (default: 1).
+        """
+        self._cache_generation += 1
+        if address is None:
+            for cached_address, cached_count in list(self._cache):
+                if self._cache_ttl_ms(cached_address, cached_count) != math.inf:
+                    del self._cache[(cached_address, cached_count)]
+            return
+        for cached_address, cached_count in list(self._cache):
+            if cached_address < address + count and address < (
+                cached_address + cached_count
+            ):
+                del self._cache[(cached_address, cached_count)]
+
+    def _forget_kinematic_motions(self, address: int, count: int) -> None:
+        """
+        Drops remembered kinematic motions that a register write may change.
+
+        Args:
+            address (int): The starting address of the registers written.
+            count (int): The number of registers written.
+        """
+        if address <= constants.CTRL_REG_4 and constants.CTRL_REG_0 < (address + count):
+            # Control register writes can reset the kinematic configuration.
+            self._kinematic_motions.clear()
+            return
+        first_id: int = (address - constants.KIN_MOTION_0) // KIN_MOTION_REGISTER_COUNT
+        last_id: int = (
+            address + count - 1 - constants.KIN_MOTION_0
+        ) // KIN_MOTION_REGISTER_COUNT
+        for motion_id in range(max(first_id, 0), last_id + 1):
+            self._kinematic_motions.pop(motion_id, None)
+
     async def manage_high_speed_stream(
         self, enable: bool, baud_rate: int, delay_us: int
     ) -> Union[ManageHighSpeedStreamResult, None]:
@@ -760,14 +1524,10 @@ class OrcaActuator:
                 high-speed stream management command, or None if an error
                 occurred.
         """
-        request = ManageHighSpeedStreamRequest(enable, baud_rate, delay_us)
-        response: ManageHighSpeedStreamResponse = await self.client.execute(
-            request
-        )  # pyright: ignore[reportAssignmentType]
-        if response.isError():
-            print(f"Error managing high-speed stream: {response}")
-            return None
-        return response.result
+        request = ManageHighSpeedStreamRequest(
+            enable, baud_rate, delay_us, slave=self.slave_address
+        )
+        return await self._execute_stream(request, "managing high-speed stream")
 
     async def motor_command_stream(
         self, sub_function_code: int, data: int
@@ -784,16 +1544,13 @@ class OrcaActuator:
             Union[MotorCommandStreamResult, None]: The result of the motor
                 command stream message, or None if an error occurred.
         """
+        # Stream commands can change any register.
+        self.invalidate_cache()
+        self._kinematic_motions.clear()
         request = MotorCommandStreamRequest(
             sub_function_code, data, slave=self.slave_address
         )
-        response: MotorCommandStreamResponse = await self.client.execute(
-            request
-        )  # pyright: ignore[reportAssignmentType]
-        if response.isError():
-            print(f"Error sending motor command stream: {response}")
-            return None
-        response.result
+        return await self._execute_stream(request, "sending motor command stream")
 
     async def motor_read_stream(
         self, register_address: int, register_width: int
@@ -813,13 +1570,7 @@ class OrcaActuator:
         request = MotorReadStreamRequest(
             register_address, register_width, slave=self.slave_address
         )
-        response: MotorReadStreamResponse = await self.client.execute(
-            request
-        )  # pyright: ignore[reportAssignmentType]
-        if response.isError():
-            print(f"Error sending motor read stream: {response}")
-            return None
-        return response.result
+        return await self._execute_stream(request, "sending motor read stream")
 
     async def motor_write_stream(
         self, register_address: int, register_width: int, data: int
@@ -837,19 +1588,246 @@ class OrcaActuator:
             Union[MotorWriteStreamResult, None]: The result of the motor write
                 stream function, or None if an error occurred.
         """
+        # Stream commands can change any register.
+        self.invalidate_cache()
+        self._kinematic_motions.clear()
         request = MotorWriteStreamRequest(
             register_address, register_width, data, slave=self.slave_address
         )
-        response: MotorWriteStreamResponse = await self.client.execute(
-            request
-        )  # pyright: ignore[reportAssignmentType]
-        if response.isError():
-            print(f"Error sending motor write stream: {response}")
+        return await self._execute_stream(request, "sending motor write stream")
+
+    async def motor_read_u16(
+        self, register_address: int
+    ) -> Union[MotorReadStreamResult, None]:
+        """
+        Reads a single wide (16 bit) register using the motor read stream
+        function.
+
+        Args:
+            register_address (int): The address of the register to read.
+
+        Returns:
+            Union[MotorReadStreamResult, None]: The result of the motor read
+                stream function, or None if an error occurred.
+        """
+        return await self._execute_stream(
+            MotorReadStreamRequest(register_address, 1, slave=self.slave_address),
+            "sending motor read stream",
+        )
+
+    async def motor_read_u32(
+        self, register_address: int
+    ) -> Union[MotorReadStreamResult, None]:
+        """
+        Reads a double wide (32 bit) register using the motor read stream
+        function.
+
+        Args:
+            register_address (int): The address of the low register to read.
+
+        Returns:
+            Union[MotorReadStreamResult, None]: The result of the motor read
+                stream function, or None if an error occurred.
+        """
+        return await self._execute_stream(
+            MotorReadStreamRequest(register_address, 2, slave=self.slave_address),
+            "sending motor read stream",
+        )
+
+    async def motor_write_u16(
+        self, register_address: int, data: int
+    ) -> Union[MotorWriteStreamResult, None]:
+        """
+        Writes a single wide (16 bit) register using the motor write stream
+        function.
+
+        Args:
+            register_address (int): The address of the register to write to.
+            data (int): The data to write to the register.
+
+        Returns:
+            Union[MotorWriteStreamResult, None]: The result of the motor write
+                stream function, or None if an error occurred.
+        """
+        # Stream commands can change any register.
+        self.invalidate_cache()
+        self._kinematic_motions.clear()
+        return await self._execute_stream(
+            MotorWriteStreamRequest(
+                register_address, 1, data & 0xFFFF, slave=self.slave_address
+            ),
+            "sending motor write stream",
+        )
+
+    async def motor_write_u32(
+        self, register_address: int, data: int
+    ) -> Union[MotorWriteStreamResult, None]:
+        """
+        Writes a double wide (32 bit) register using the motor write stream
+        function.
+
+        Args:
+            register_address (int): The address of the low register to write to.
+            data (int): The data to write to the register. Negative values are
+                written as their 32 bit two's complement.
+
+        Returns:
+            Union[MotorWriteStreamResult, None]: The result of the motor write
+                stream function, or None if an error occurred.
+        """
+        # Stream commands can change any register.
+        self.invalidate_cache()
+        self._kinematic_motions.clear()
+        return await self._execute_stream(
+            MotorWriteStreamRequest(
+                register_address, 2, data & 0xFFFFFFFF, slave=self.slave_address
+            ),
+            "sending motor write stream",
+        )
+
+    async def execute_many(self, requests: List[ModbusRequest]) -> List[Any]:
+        """
+        Executes several stream requests back to back.
+
+        All requests are queued on the client at once. The client frames each
+        request before taking the bus and serializes the transactions in
+        order, so request N+1 is framed while request N is in flight and is
+        sent as soon as response N has been decoded.
+
+        Args:
+            requests (List[ModbusRequest]): The stream requests to execute, in
+                order.
+
+        Returns:
+            List[Any]: The result of each request in the order given, or None
+                for any request that failed.
+        """
+        # The requests may include command or write streams.
+        self.invalidate_cache()
+        self._kinematic_motions.clear()
+        return list(
+            await asyncio.gather(
+                *(
+                    self._execute_stream(request, "executing stream request")
+                    for request in requests
+                )
+            )
+        )
+
+    async def motor_read_stream_batch(
+        self, queries: Sequence[Tuple[int, int]]
+    ) -> List[Union[MotorReadStreamResult, None]]:
+        """
+        Reads several registers back to back using the motor read stream
+        function.
+
+        The reads are queued together as in execute_many, but since they
+        cannot change any register the register cache is left intact.
+
+        Args:
+            queries (Sequence[Tuple[int, int]]): The (register_address,
+                register_width) of each read, with a width of 1 for single wide
+                and 2 for double wide registers.
+
+        Returns:
+            List[Union[MotorReadStreamResult, None]]: The result of each read in
+                the order given, or None for any read that failed.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self._execute_stream(
+                        MotorReadStreamRequest(
+                            register_address, register_width, slave=self.slave_address
+                        ),
+                        "sending motor read stream",
+                    )
+                    for register_address, register_width in queries
+                )
+            )
+        )
+
+    async def _execute_stream(self, request: ModbusRequest, description: str) -> Any:
+        """
+        Executes a custom stream request and returns its parsed result.
+
+        Args:
+            request (ModbusRequest): The stream request to execute.
+            description (str): What the request does, used in error messages.
+
+        Returns:
+            Any: The result of the stream response, or None if an error
+                occurred.
+        """
+        try:
+            response: ModbusResponse = await self._execute(request)
+            if response.isError():
+                logger.error("Error %s: %s", description, response)
+                return None
+            return response.result  # pyright: ignore[reportAttributeAccessIssue]
+        except ModbusIOException as e:
+            logger.error("Modbus IO Error: %s", e)
             return None
-        response.result
 
     def close(self) -> None:
         """
-        Closes the Modbus connection.
-        """
+        Closes the Modbus connection once no other actuator is using it.
+
+        Closing an actuator more than once has no further effect.
+        """
+        with OrcaActuator._client_pool_lock:
+            if self._closed:
+                return
+            self._closed = True
+            if OrcaActuator._client_pool.get(self.port) is not self.client:
+                return
+            OrcaActuator._client_ref_counts[self.port] -= 1
+            if OrcaActuator._client_ref_counts[self.port] > 0:
+                return
+            del OrcaActuator._client_pool[self.port]
+            del OrcaActuator._client_ref_counts[self.port]
         self.client.close()
+
+    async def __aenter__(self) -> "OrcaActuator":
+        """
+        Connects to the actuator, keeping the connection open for every
+        request made until the block exits.
+
+        Raises:
+            ConnectionException: If the connection could not be started.
+        """
+        if not await self.connect():
+            raise ConnectionException(f"Failed to connect to {self.port}")
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Closes the connection to the actuator."""
+        self.close()
+
+
+async def gather_reads(
+    actuators: List[OrcaActuator], address: int, count: int = 1
+) -> List[Union[list, None]]:
+    """
+    Reads the same registers from several actuators concurrently.
+
+    Actuators on separate serial ports have independent bandwidth, so their
+    reads overlap and the total time approaches that of a single read.
+    Actuators sharing a port (a multi-drop bus addressed by slave address)
+    share one client, which serializes their requests on the wire as Modbus
+    RTU requires while letting them be issued concurrently.
+
+    Args:
+        actuators (List[OrcaActuator]): The actuators to read from.
+        address (int): The starting address of the register(s) to read.
+        count (int): The number of registers to read (default: 1).
+
+    Returns:
+        List[Union[list, None]]: The register values read from each actuator,
+            in the order given, or None for any actuator whose read failed.
+    """
+    return list(
+        await asyncio.gather(
+            *(actuator.read_register(address, count) for actuator in actuators)
+        )
+    )
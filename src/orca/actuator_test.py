@@ -0,0 +1,162 @@
+import asyncio
+import types
+import unittest
+from typing import Dict, List, Tuple
+
+from src.orca import constants
+from src.orca.actuator import MAX_READ_REGISTER_COUNT, OrcaActuator
+
+
+class FakeReadResponse:
+    """A successful read holding registers response."""
+
+    def __init__(self, registers: list):
+        self.registers: list = registers
+
+    def isError(self) -> bool:
+        return False
+
+
+class FakeWriteResponse:
+    """A successful write response."""
+
+    def isError(self) -> bool:
+        return False
+
+
+class ReadRegisterTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # The Modbus client is created on the running event loop.
+        self.actuator = OrcaActuator(port="/dev/null")
+        # (address, count) of each transaction sent to the actuator.
+        self.transactions: List[Tuple[int, int]] = []
+
+        async def read_holding_registers(address: int, count: int):
+            self.transactions.append((address, count))
+            # Each register holds its own address.
+            return FakeReadResponse(list(range(address, address + count)))
+
+        self.actuator._read_holding_registers = read_holding_registers
+
+    async def asyncTearDown(self):
+        self.actuator.close()
+
+    async def test_overlapping_reads_past_register_cap(self):
+        first, second = await asyncio.gather(
+            self.actuator.read_register(0, 100),
+            self.actuator.read_register(50, 100),
+        )
+        self.assertEqual(first, list(range(0, 100)))
+        self.assertEqual(second, list(range(50, 150)))
+        for _, count in self.transactions:
+            self.assertLessEqual(count, MAX_READ_REGISTER_COUNT)
+        # The values cached for each read must be the complete read.
+        self.assertEqual(
+            await self.actuator.read_register(50, 100), list(range(50, 150))
+        )
+
+    async def test_adjacent_reads_share_transaction(self):
+        first, second = await asyncio.gather(
+            self.actuator.read_register(10, 2),
+            self.actuator.read_register(12, 3),
+        )
+        self.assertEqual(first, [10, 11])
+        self.assertEqual(second, [12, 13, 14])
+        self.assertEqual(self.transactions, [(10, 5)])
+
+
+class RegisterCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # The Modbus client is created on the running event loop.
+        self.actuator = OrcaActuator(port="/dev/null", cache_ttl_ms=20)
+        # Register values by address, 0 for any register not written.
+        self.registers: Dict[int, int] = {}
+        self.read_count: int = 0
+
+        async def read_holding_registers(address: int, count: int):
+            self.read_count += 1
+            return FakeReadResponse(
+                [self.registers.get(a, 0) for a in range(address, address + count)]
+            )
+
+        async def write_register(address: int, value: int):
+            self.registers[address] = value
+            return FakeWriteResponse()
+
+        self.actuator._read_holding_registers = read_holding_registers
+        self.actuator._write_register = write_register
+
+    async def asyncTearDown(self):
+        self.actuator.close()
+
+    async def test_read_served_from_cache_until_ttl_expires(self):
+        self.registers[constants.SHAFT_POS_UM] = 1
+        self.assertEqual(await self.actuator.read_register(constants.SHAFT_POS_UM), [1])
+        self.registers[constants.SHAFT_POS_UM] = 2
+        self.assertEqual(await self.actuator.read_register(constants.SHAFT_POS_UM), [1])
+        self.assertEqual(self.read_count, 1)
+        await asyncio.sleep(0.03)
+        self.assertEqual(await self.actuator.read_register(constants.SHAFT_POS_UM), [2])
+        self.assertEqual(self.read_count, 2)
+
+    async def test_write_invalidates_cached_read(self):
+        self.assertEqual(
+            await self.actuator.read_register(constants.COMMS_TIMEOUT), [0]
+        )
+        await self.actuator.write_register(constants.COMMS_TIMEOUT, 500)
+        self.assertEqual(
+            await self.actuator.read_register(constants.COMMS_TIMEOUT), [500]
+        )
+
+    async def test_identity_read_cached_across_writes_and_ttl(self):
+        self.registers[constants.SERIAL_NUMBER_LOW] = 1234
+        self.assertEqual(
+            await self.actuator.read_register(constants.SERIAL_NUMBER_LOW, 2),
+            [1234, 0],
+        )
+        await self.actuator.write_register(constants.COMMS_TIMEOUT, 500)
+        await asyncio.sleep(0.03)
+        self.assertEqual(
+            await self.actuator.read_register(constants.SERIAL_NUMBER_LOW, 2),
+            [1234, 0],
+        )
+        self.assertEqual(self.read_count, 1)
+
+    async def test_read_past_identity_registers_is_not_static(self):
+        count: int = constants.COMMS_TIMEOUT - constants.SERIAL_NUMBER_LOW + 1
+        values = await self.actuator.read_register(constants.SERIAL_NUMBER_LOW, count)
+        self.assertEqual(values[-1], 0)
+        await self.actuator.write_register(constants.COMMS_TIMEOUT, 500)
+        values = await self.actuator.read_register(constants.SERIAL_NUMBER_LOW, count)
+        self.assertEqual(values[-1], 500)
+
+
+class NonLinuxSerial:
+    """A pyserial port on a POSIX platform without low latency support."""
+
+    def set_low_latency_mode(self, low_latency_settings: bool) -> None:
+        raise NotImplementedError("Low latency not supported on this platform")
+
+
+class ConnectTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # The Modbus client is created on the running event loop.
+        self.actuator = OrcaActuator(port="/dev/null")
+
+    async def asyncTearDown(self):
+        self.actuator.client.transport = None
+        self.actuator.close()
+
+    async def test_connect_without_low_latency_support(self):
+        client = self.actuator.client
+
+        async def connect() -> bool:
+            client.transport = types.SimpleNamespace(sync_serial=NonLinuxSerial())
+            return True
+
+        client.connect = connect
+        self.assertTrue(await self.actuator.connect())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,13 @@
-import numpy as np
-
-
-def get_lsb(value: np.int32) -> int:
+def get_lsb(value: int) -> int:
     """Gets the least significant bits of a given 32bit int."""
-    return np.bitwise_and([value], [0xFFFF])[0].item()
+    return int(value) & 0xFFFF
 
 
-def get_msb(value: np.int32) -> int:
+def get_msb(value: int) -> int:
     """Gets the most significant bits of a given 32bit int."""
-    return np.right_shift(value, 16).item()
+    return int(value) >> 16
 
 
-def combine_low_high(low: np.uint16, high: np.uint16) -> int:
+def combine_low_high(low: int, high: int) -> int:
     """Returns a uint32 (as int) from combining the low and high bits."""
-    return ((high * (np.left_shift(1, 16))) + low).item()
+    return (int(high) << 16) | int(low)
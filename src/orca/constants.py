@@ -1,210 +1,208 @@
-from dataclasses import dataclass
+from typing import Final
 
 
-@dataclass(frozen=True)
-class OrcaConstants:
-    #########
-    # Modes #
-    #########
-    MODE_SLEEP = 1
-    MODE_FORCE = 2
-    MODE_POSITION = 3
-    MODE_HAPTIC = 4
-    MODE_KINEMATIC = 5
-    MODE_AUTO_ZERO = 55
-    MODE_OF_OPERATION = 317
-    #####################
-    # Control Registers #
-    #####################
-    CTRL_REG_0 = 0  # System info.
-    CTRL_REG_0_FULL_RESET = 1
-    CTRL_REG_0_CLEAR_ERRORS = 2
-    CTRL_REG_0_ZERO_POSITION = 4
-    CTRL_REG_0_INVERT_POSITION = 8
-    CTRL_REG_1 = 1  # System flags & calibration.
-    CTRL_REG_1_SET_POSITION_CONTROLLER_GAIN = 1024
-    CTRL_REG_2 = 2  # Write to permenant memory.
-    CTRL_REG_2_SAVE_PARAMS = 1
-    CTRL_REG_2_SAVE_TUNING = 32
-    CTRL_REG_2_SAVE_USER_OPTS = 64
-    CTRL_REG_2_SAVE_KINEMATIC_CONFIG = 128
-    CTRL_REG_2_SAVE_HAPTIC_CONFIG = 512
-    CTRL_REG_3 = 3  # Configure mode.
-    CTRL_REG_4 = 4  # Configure defaults.
-    CTRL_REG_4_SET_DEFAULT_PARAMS = 1
-    CTRL_REG_4_SET_DEFAULT_TUNING = 2
-    CTRL_REG_4_SET_DEFAULT_MOTOR_USER_OPTS = 4
-    CTRL_REG_4_SET_DEFAULT_MODBUS_USER_OPTS = 8
-    CTRL_REG_4_SET_DEFAULT_KINEMATIC_CONFIG = 16
-    CTRL_REG_4_SET_DEFAULT_HAPTIC_CONFIG = 32
-    #############
-    # Kinematic #
-    #############
-    KIN_SW_TRIGGER = 9
-    KIN_MOTION_0 = 780
-    KIN_MOTION_1 = 786
-    KIN_MOTION_2 = 792
-    KIN_MOTION_3 = 798
-    KIN_MOTION_4 = 804
-    KIN_MOTION_5 = 810
-    KIN_MOTION_6 = 816
-    KIN_MOTION_7 = 822
-    KIN_MOTION_8 = 828
-    KIN_MOTION_9 = 834
-    KIN_MOTION_10 = 840
-    KIN_MOTION_11 = 846
-    KIN_MOTION_12 = 852
-    KIN_MOTION_13 = 858
-    KIN_MOTION_14 = 864
-    KIN_MOTION_15 = 870
-    KIN_MOTION_16 = 876
-    KIN_MOTION_17 = 882
-    KIN_MOTION_18 = 888
-    KIN_MOTION_19 = 894
-    KIN_MOTION_20 = 900
-    KIN_MOTION_21 = 906
-    KIN_MOTION_22 = 912
-    KIN_MOTION_23 = 918
-    KIN_MOTION_24 = 924
-    KIN_MOTION_25 = 930
-    KIN_MOTION_26 = 936
-    KIN_MOTION_27 = 942
-    KIN_MOTION_28 = 948
-    KIN_MOTION_29 = 954
-    KIN_MOTION_30 = 960
-    KIN_MOTION_31 = 966
-    KIN_HOME_ID = 972
-    KINEMATIC_STATUS = 319
-    ##################
-    # Haptic Effects #
-    ##################
-    # Constant Force.
-    CONSTANT_FORCE_MN = 642
-    CONSTANT_FORCE_MN_H = 643
-    CONST_FORCE_FILTER = 672
-    # Spring 0.
-    S0_GAIN_N_MM = 644
-    S0_CENTER_UM = 645
-    S0_CENTER_UM_H = 646
-    S0_COUPLING = 647
-    S0_DEAD_ZONE_MM = 648
-    S0_FORCE_SAT_N = 649
-    # Spring 1.
-    S1_GAIN_N_MM = 650
-    S1_CENTER_UM = 651
-    S1_CENTER_UM_H = 652
-    S1_COUPLING = 653
-    S1_DEAD_ZONE_MM = 654
-    S1_FORCE_SAT_N = 655
-    # Spring 2.
-    S1_GAIN_N_MM = 656
-    S1_CENTER_UM = 657
-    S1_CENTER_UM_H = 658
-    S1_COUPLING = 659
-    S1_DEAD_ZONE_MM = 660
-    S1_FORCE_SAT_N = 661
-    # Damper.
-    D0_GAIN_NS_MM = 662
-    # Inertia.
-    I0_GAIN_NS2_MM = 663
-    # Oscillator 0.
-    O0_GAIN_N = 664
-    O0_TYPE = 665
-    O0_FREQ_DHZ = 666
-    O0_DUTY = 667
-    # Oscillator 1.
-    O0_GAIN_N = 668
-    O0_TYPE = 669
-    O0_FREQ_DHZ = 670
-    O0_DUTY = 671
-    #######################
-    # Position Controller #
-    #######################
-    PC_PGAIN = 133
-    PC_IGAIN = 134
-    PC_DVGAIN = 135
-    PC_DEGAIN = 136
-    PC_FSATU = 137
-    PC_FSATU_H = 138
-    #############
-    # Auto Zero #
-    #############
-    ZERO_MODE = 171
-    AUTO_ZERO_FORCE_N = 172
-    AUTO_ZERO_EXIT_MODE = 173
-    AUTO_ZERO_MODE_NEGATIVE = 0
-    AUTO_ZERO_MODE_MANUAL = 1
-    AUTO_ZERO_MODE_ENABLED = 2
-    AUTO_ZERO_MODE_ON_BOOT = 3
-    ###########
-    # Sensors #
-    ###########
-    STATOR_TEMP = 336
-    DRIVER_TEMP = 337
-    VDD_FINAL = 338
-    SHAFT_POS_UM = 342
-    SHAFT_POSITION_H = 343
-    SHAFT_SPEED_MMPS = 344
-    SHAFT_SHEED_H = 345
-    SHAFT_ACCEL_MMPSS = 346
-    SHAFT_ACCEL_H = 347
-    FORCE = 348
-    FORCE_H = 349
-    POWER = 350
-    AVG_POWER = 355
-    COIL_TEMP = 356
-    ##########
-    # Limits #
-    ##########
-    # Actuator.
-    MAX_TEMP = 401
-    MIN_VOLTAGE = 402
-    MAX_VOLTAGE = 403
-    MAX_CURRENT = 404
-    MAX_POWER = 405
-    # User.
-    USER_MAX_TEMP = 139
-    USER_MAX_FORCE = 140
-    USER_MAX_FORCE_H = 141
-    USER_MAX_POWER = 142
-    SAFETY_DGAIN = 143
-    #################
-    # Actuator Info #
-    #################
-    SERIAL_NUMBER_LOW = 406
-    SERIAL_NUMBER_HIGH = 407
-    MAJOR_VERSION = 408
-    RELEASE_STATE = 409
-    REVISION_NUMBER = 410
-    COMMIT_ID_LO = 411
-    COMMIT_ID_HI = 412
-    HW_VERSION = 414
-    COMMS_TIMEOUT = 417
-    STATOR_CONFIG = 418
-    ########################
-    # Motor Command Stream #
-    ########################
-    MOTOR_COMMAND_STREAM_FORCE = 28
-    MOTOR_COMMAND_STREAM_POSITION = 30
-    MOTOR_COMMAND_STREAM_KINEMATIC = 32
-    MOTOR_COMMAND_STREAM_HAPTIC = 34
-    ############
-    # Commands #
-    ############
-    MOTOR_COMMAND_FORCE = 28
-    MOTOR_COMMAND_FORCE_H = 29
-    MOTOR_COMMAND_POS = 30
-    MOTOR_COMMAND_POS_H = 31
-    ##########
-    # Errors #
-    ##########
-    ERROR_0 = 432
-    ERROR_1 = 433
-    ERROR_CONFIGURATION = 1
-    ERROR_FORCE_CLIPPING = 32
-    ERROR_TEMPERATURE_EXCEEDED = 64
-    ERROR_FORCE_EXCEEDED = 128
-    ERROR_POWER_EXCEEDED = 256
-    ERROR_SHAFT_IMAGE_FAILED = 512
-    ERROR_VOLTAGE_INVALID = 1024
-    ERROR_COMMS_TIMEOUT = 2048
+#########
+# Modes #
+#########
+MODE_SLEEP: Final[int] = 1
+MODE_FORCE: Final[int] = 2
+MODE_POSITION: Final[int] = 3
+MODE_HAPTIC: Final[int] = 4
+MODE_KINEMATIC: Final[int] = 5
+MODE_AUTO_ZERO: Final[int] = 55
+MODE_OF_OPERATION: Final[int] = 317
+#####################
+# Control Registers #
+#####################
+CTRL_REG_0: Final[int] = 0  # System info.
+CTRL_REG_0_FULL_RESET: Final[int] = 1
+CTRL_REG_0_CLEAR_ERRORS: Final[int] = 2
+CTRL_REG_0_ZERO_POSITION: Final[int] = 4
+CTRL_REG_0_INVERT_POSITION: Final[int] = 8
+CTRL_REG_1: Final[int] = 1  # System flags & calibration.
+CTRL_REG_1_SET_POSITION_CONTROLLER_GAIN: Final[int] = 1024
+CTRL_REG_2: Final[int] = 2  # Write to permenant memory.
+CTRL_REG_2_SAVE_PARAMS: Final[int] = 1
+CTRL_REG_2_SAVE_TUNING: Final[int] = 32
+CTRL_REG_2_SAVE_USER_OPTS: Final[int] = 64
+CTRL_REG_2_SAVE_KINEMATIC_CONFIG: Final[int] = 128
+CTRL_REG_2_SAVE_HAPTIC_CONFIG: Final[int] = 512
+CTRL_REG_3: Final[int] = 3  # Configure mode.
+CTRL_REG_4: Final[int] = 4  # Configure defaults.
+CTRL_REG_4_SET_DEFAULT_PARAMS: Final[int] = 1
+CTRL_REG_4_SET_DEFAULT_TUNING: Final[int] = 2
+CTRL_REG_4_SET_DEFAULT_MOTOR_USER_OPTS: Final[int] = 4
+CTRL_REG_4_SET_DEFAULT_MODBUS_USER_OPTS: Final[int] = 8
+CTRL_REG_4_SET_DEFAULT_KINEMATIC_CONFIG: Final[int] = 16
+CTRL_REG_4_SET_DEFAULT_HAPTIC_CONFIG: Final[int] = 32
+#############
+# Kinematic #
+#############
+KIN_SW_TRIGGER: Final[int] = 9
+KIN_MOTION_0: Final[int] = 780
+KIN_MOTION_1: Final[int] = 786
+KIN_MOTION_2: Final[int] = 792
+KIN_MOTION_3: Final[int] = 798
+KIN_MOTION_4: Final[int] = 804
+KIN_MOTION_5: Final[int] = 810
+KIN_MOTION_6: Final[int] = 816
+KIN_MOTION_7: Final[int] = 822
+KIN_MOTION_8: Final[int] = 828
+KIN_MOTION_9: Final[int] = 834
+KIN_MOTION_10: Final[int] = 840
+KIN_MOTION_11: Final[int] = 846
+KIN_MOTION_12: Final[int] = 852
+KIN_MOTION_13: Final[int] = 858
+KIN_MOTION_14: Final[int] = 864
+KIN_MOTION_15: Final[int] = 870
+KIN_MOTION_16: Final[int] = 876
+KIN_MOTION_17: Final[int] = 882
+KIN_MOTION_18: Final[int] = 888
+KIN_MOTION_19: Final[int] = 894
+KIN_MOTION_20: Final[int] = 900
+KIN_MOTION_21: Final[int] = 906
+KIN_MOTION_22: Final[int] = 912
+KIN_MOTION_23: Final[int] = 918
+KIN_MOTION_24: Final[int] = 924
+KIN_MOTION_25: Final[int] = 930
+KIN_MOTION_26: Final[int] = 936
+KIN_MOTION_27: Final[int] = 942
+KIN_MOTION_28: Final[int] = 948
+KIN_MOTION_29: Final[int] = 954
+KIN_MOTION_30: Final[int] = 960
+KIN_MOTION_31: Final[int] = 966
+KIN_HOME_ID: Final[int] = 972
+KINEMATIC_STATUS: Final[int] = 319
+##################
+# Haptic Effects #
+##################
+# Constant Force.
+CONSTANT_FORCE_MN: Final[int] = 642
+CONSTANT_FORCE_MN_H: Final[int] = 643
+CONST_FORCE_FILTER: Final[int] = 672
+# Spring 0.
+S0_GAIN_N_MM: Final[int] = 644
+S0_CENTER_UM: Final[int] = 645
+S0_CENTER_UM_H: Final[int] = 646
+S0_COUPLING: Final[int] = 647
+S0_DEAD_ZONE_MM: Final[int] = 648
+S0_FORCE_SAT_N: Final[int] = 649
+# Spring 1.
+S1_GAIN_N_MM: Final[int] = 650
+S1_CENTER_UM: Final[int] = 651
+S1_CENTER_UM_H: Final[int] = 652
+S1_COUPLING: Final[int] = 653
+S1_DEAD_ZONE_MM: Final[int] = 654
+S1_FORCE_SAT_N: Final[int] = 655
+# Spring 2.
+S2_GAIN_N_MM: Final[int] = 656
+S2_CENTER_UM: Final[int] = 657
+S2_CENTER_UM_H: Final[int] = 658
+S2_COUPLING: Final[int] = 659
+S2_DEAD_ZONE_MM: Final[int] = 660
+S2_FORCE_SAT_N: Final[int] = 661
+# Damper.
+D0_GAIN_NS_MM: Final[int] = 662
+# Inertia.
+I0_GAIN_NS2_MM: Final[int] = 663
+# Oscillator 0.
+O0_GAIN_N: Final[int] = 664
+O0_TYPE: Final[int] = 665
+O0_FREQ_DHZ: Final[int] = 666
+O0_DUTY: Final[int] = 667
+# Oscillator 1.
+O1_GAIN_N: Final[int] = 668
+O1_TYPE: Final[int] = 669
+O1_FREQ_DHZ: Final[int] = 670
+O1_DUTY: Final[int] = 671
+#######################
+# Position Controller #
+#######################
+PC_PGAIN: Final[int] = 133
+PC_IGAIN: Final[int] = 134
+PC_DVGAIN: Final[int] = 135
+PC_DEGAIN: Final[int] = 136
+PC_FSATU: Final[int] = 137
+PC_FSATU_H: Final[int] = 138
+#############
+# Auto Zero #
+#############
+ZERO_MODE: Final[int] = 171
+AUTO_ZERO_FORCE_N: Final[int] = 172
+AUTO_ZERO_EXIT_MODE: Final[int] = 173
+AUTO_ZERO_MODE_NEGATIVE: Final[int] = 0
+AUTO_ZERO_MODE_MANUAL: Final[int] = 1
+AUTO_ZERO_MODE_ENABLED: Final[int] = 2
+AUTO_ZERO_MODE_ON_BOOT: Final[int] = 3
+###########
+# Sensors #
+###########
+STATOR_TEMP: Final[int] = 336
+DRIVER_TEMP: Final[int] = 337
+VDD_FINAL: Final[int] = 338
+SHAFT_POS_UM: Final[int] = 342
+SHAFT_POSITION_H: Final[int] = 343
+SHAFT_SPEED_MMPS: Final[int] = 344
+SHAFT_SHEED_H: Final[int] = 345
+SHAFT_ACCEL_MMPSS: Final[int] = 346
+SHAFT_ACCEL_H: Final[int] = 347
+FORCE: Final[int] = 348
+FORCE_H: Final[int] = 349
+POWER: Final[int] = 350
+AVG_POWER: Final[int] = 355
+COIL_TEMP: Final[int] = 356
+##########
+# Limits #
+##########
+# Actuator.
+MAX_TEMP: Final[int] = 401
+MIN_VOLTAGE: Final[int] = 402
+MAX_VOLTAGE: Final[int] = 403
+MAX_CURRENT: Final[int] = 404
+MAX_POWER: Final[int] = 405
+# User.
+USER_MAX_TEMP: Final[int] = 139
+USER_MAX_FORCE: Final[int] = 140
+USER_MAX_FORCE_H: Final[int] = 141
+USER_MAX_POWER: Final[int] = 142
+SAFETY_DGAIN: Final[int] = 143
+#################
+# Actuator Info #
+#################
+SERIAL_NUMBER_LOW: Final[int] = 406
+SERIAL_NUMBER_HIGH: Final[int] = 407
+MAJOR_VERSION: Final[int] = 408
+RELEASE_STATE: Final[int] = 409
+REVISION_NUMBER: Final[int] = 410
+COMMIT_ID_LO: Final[int] = 411
+COMMIT_ID_HI: Final[int] = 412
+HW_VERSION: Final[int] = 414
+COMMS_TIMEOUT: Final[int] = 417
+STATOR_CONFIG: Final[int] = 418
+########################
+# Motor Command Stream #
+########################
+MOTOR_COMMAND_STREAM_FORCE: Final[int] = 28
+MOTOR_COMMAND_STREAM_POSITION: Final[int] = 30
+MOTOR_COMMAND_STREAM_KINEMATIC: Final[int] = 32
+MOTOR_COMMAND_STREAM_HAPTIC: Final[int] = 34
+############
+# Commands #
+############
+MOTOR_COMMAND_FORCE: Final[int] = 28
+MOTOR_COMMAND_FORCE_H: Final[int] = 29
+MOTOR_COMMAND_POS: Final[int] = 30
+MOTOR_COMMAND_POS_H: Final[int] = 31
+##########
+# Errors #
+##########
+ERROR_0: Final[int] = 432
+ERROR_1: Final[int] = 433
+ERROR_CONFIGURATION: Final[int] = 1
+ERROR_FORCE_CLIPPING: Final[int] = 32
+ERROR_TEMPERATURE_EXCEEDED: Final[int] = 64
+ERROR_FORCE_EXCEEDED: Final[int] = 128
+ERROR_POWER_EXCEEDED: Final[int] = 256
+ERROR_SHAFT_IMAGE_FAILED: Final[int] = 512
+ERROR_VOLTAGE_INVALID: Final[int] = 1024
+ERROR_COMMS_TIMEOUT: Final[int] = 2048
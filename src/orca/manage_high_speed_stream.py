@@ -1,6 +1,6 @@
 import struct
 from dataclasses import dataclass
-from typing import Union
+from typing import Sequence, Union
 
 from pymodbus.pdu import ModbusRequest, ModbusResponse
 
@@ -9,9 +9,16 @@ MANAGE_HIGH_SPEED_STREAM_FUNCTION_CODE: int = 65
 MANAGE_HIGH_SPEED_STREAM_RESPONSE_FORMAT: str = ">BIH"
 MANAGE_HIGH_SPEED_STREAM_REQUEST_FORMAT: str = ">HIH"
 MANAGE_HIGH_SPEED_STREAM_RESPONSE_NUM_EXPECTED_VALUES: int = 3
+# Compiled once so encoding and decoding skip parsing the format strings.
+MANAGE_HIGH_SPEED_STREAM_RESPONSE_STRUCT: struct.Struct = struct.Struct(
+    MANAGE_HIGH_SPEED_STREAM_RESPONSE_FORMAT
+)
+MANAGE_HIGH_SPEED_STREAM_REQUEST_STRUCT: struct.Struct = struct.Struct(
+    MANAGE_HIGH_SPEED_STREAM_REQUEST_FORMAT
+)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ManageHighSpeedStreamResult:
     state_command: int
     realized_baud_rate: int
@@ -20,48 +27,37 @@ class ManageHighSpeedStreamResult:
 
 class ManageHighSpeedStreamResponse(ModbusResponse):
     function_code: int = MANAGE_HIGH_SPEED_STREAM_FUNCTION_CODE
-    _rtu_frame_size: int = (
-        struct.calcsize(MANAGE_HIGH_SPEED_STREAM_RESPONSE_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MANAGE_HIGH_SPEED_STREAM_RESPONSE_STRUCT.size + FRAMER_BYTES
 
-    def __init__(self, values: Union[list, None] = None, **kwargs):
+    def __init__(self, values: Union[Sequence[int], None] = None, **kwargs):
         """Initialize response."""
         ModbusResponse.__init__(self, **kwargs)
-        self.format: str = MANAGE_HIGH_SPEED_STREAM_RESPONSE_FORMAT
-        self.values: list = values or []
+        self.values: Sequence[int] = values or ()
         self.result: Union[ManageHighSpeedStreamResult, None] = None
-        self._maybe_init_from_values()
+        if self.values:
+            self._init_result_from_values()
 
-    def _maybe_init_from_values(self) -> None:
+    def _init_result_from_values(self) -> None:
         """Initialize member variables from supplied values."""
-        if self.values:
-            self.result = ManageHighSpeedStreamResult(
-                state_command=self.values[0],
-                realized_baud_rate=self.values[1],
-                realized_delay_us=self.values[2],
-            )
+        self.result = ManageHighSpeedStreamResult(
+            state_command=self.values[0],
+            realized_baud_rate=self.values[1],
+            realized_delay_us=self.values[2],
+        )
 
     def encode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self,
     ) -> Union[bytes, None]:
         """Encode response."""
         if self.values:
-            return struct.pack(
-                self.format,
-                *self.values,
-            )
+            return MANAGE_HIGH_SPEED_STREAM_RESPONSE_STRUCT.pack(*self.values)
 
     def decode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, data: bytes
     ) -> None:
         """Decode response."""
-        self.values = list(
-            struct.unpack(
-                self.format,
-                data[0 : struct.calcsize(self.format)],
-            )
-        )
-        self._maybe_init_from_values()
+        self.values = MANAGE_HIGH_SPEED_STREAM_RESPONSE_STRUCT.unpack_from(data)
+        self._init_result_from_values()
 
 
 class ManageHighSpeedStreamRequest(ModbusRequest):
@@ -80,13 +76,10 @@ class ManageHighSpeedStreamRequest(ModbusRequest):
     # +----------------+---------+--------------------------------+---------------------------+
     # | CRC            | 2 bytes | CRC-16 (MODBUS) Polynomial 0xA001                          |
     # +----------------+---------+--------------------------------+---------------------------+
-    _rtu_frame_size: int = (
-        struct.calcsize(MANAGE_HIGH_SPEED_STREAM_REQUEST_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MANAGE_HIGH_SPEED_STREAM_REQUEST_STRUCT.size + FRAMER_BYTES
 
     def __init__(self, enable: bool, baud_rate: int, delay_us: int, **kwargs):
         super().__init__(**kwargs)
-        self.format: str = MANAGE_HIGH_SPEED_STREAM_REQUEST_FORMAT
         self.enable: bool = enable
         self.baud_rate: int = baud_rate
         self.delay_us: int = delay_us
@@ -94,8 +87,7 @@ class ManageHighSpeedStreamRequest(ModbusRequest):
     def encode(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
         """Encode request."""
         sub_function_code: int = 0xFF00 if self.enable else 0x0000
-        return struct.pack(
-            self.format,
+        return MANAGE_HIGH_SPEED_STREAM_REQUEST_STRUCT.pack(
             sub_function_code,
             self.baud_rate,
             self.delay_us,
@@ -103,9 +95,8 @@ class ManageHighSpeedStreamRequest(ModbusRequest):
 
     def decode(self, data: bytes):  # pyright: ignore[reportIncompatibleMethodOverride]
         """Decode request."""
-        self.sub_function_code, self.baud_rate, self.delay_us = struct.unpack(
-            self.format,
-            data,
+        self.sub_function_code, self.baud_rate, self.delay_us = (
+            MANAGE_HIGH_SPEED_STREAM_REQUEST_STRUCT.unpack_from(data)
         )
         self.enable = self.sub_function_code == 0xFF00
 
@@ -1,6 +1,6 @@
 import struct
 from dataclasses import dataclass
-from typing import Union
+from typing import Sequence, Union
 
 from pymodbus.pdu import ModbusRequest, ModbusResponse
 
@@ -9,9 +9,20 @@ MOTOR_COMMAND_STREAM_FUNCTION_CODE: int = 100
 MOTOR_COMMAND_STREAM_RESPONSE_FORMAT: str = ">iiHBHH"
 MOTOR_COMMAND_STREAM_REQUEST_FORMAT: str = ">BI"
 MOTOR_COMMAND_STREAM_RESPONSE_NUM_EXPECTED_VALUES: int = 6
-
-
-@dataclass(kw_only=True)
+FORCE_CONTROL_SUB_FUNCTION_CODE: int = 0x1C
+POSITION_CONTROL_SUB_FUNCTION_CODE: int = 0x1E
+KINEMATIC_DATA_SUB_FUNCTION_CODE: int = 0x20
+HAPTIC_DATA_SUB_FUNCTION_CODE: int = 0x22
+# Compiled once so encoding and decoding skip parsing the format strings.
+MOTOR_COMMAND_STREAM_RESPONSE_STRUCT: struct.Struct = struct.Struct(
+    MOTOR_COMMAND_STREAM_RESPONSE_FORMAT
+)
+MOTOR_COMMAND_STREAM_REQUEST_STRUCT: struct.Struct = struct.Struct(
+    MOTOR_COMMAND_STREAM_REQUEST_FORMAT
+)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
 class MotorCommandStreamResult:
     position_um: int
     force_mN: int
@@ -23,51 +34,40 @@ class MotorCommandStreamResult:
 
 class MotorCommandStreamResponse(ModbusResponse):
     function_code: int = MOTOR_COMMAND_STREAM_FUNCTION_CODE
-    _rtu_frame_size: int = (
-        struct.calcsize(MOTOR_COMMAND_STREAM_RESPONSE_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MOTOR_COMMAND_STREAM_RESPONSE_STRUCT.size + FRAMER_BYTES
 
-    def __init__(self, values: Union[list, None] = None, **kwargs):
+    def __init__(self, values: Union[Sequence[int], None] = None, **kwargs):
         """Initialize response."""
         ModbusResponse.__init__(self, **kwargs)
-        self.format: str = ">IIHBHH"
-        self.values: list = values or []
+        self.values: Sequence[int] = values or ()
         self.result: Union[MotorCommandStreamResult, None] = None
-        self._maybe_init_from_values()
+        if self.values:
+            self._init_result_from_values()
 
-    def _maybe_init_from_values(self) -> None:
+    def _init_result_from_values(self) -> None:
         """Initialize result from supplied values."""
-        if self.values:
-            self.result = MotorCommandStreamResult(
-                position_um=self.values[0],
-                force_mN=self.values[1],
-                power_W=self.values[2],
-                temperature_C=self.values[3],
-                voltage_mV=self.values[4],
-                errors=self.values[5],
-            )
+        self.result = MotorCommandStreamResult(
+            position_um=self.values[0],
+            force_mN=self.values[1],
+            power_W=self.values[2],
+            temperature_C=self.values[3],
+            voltage_mV=self.values[4],
+            errors=self.values[5],
+        )
 
     def encode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self,
     ) -> Union[bytes, None]:
         """Encode response."""
         if self.values:
-            return struct.pack(
-                self.format,
-                *self.values,
-            )
+            return MOTOR_COMMAND_STREAM_RESPONSE_STRUCT.pack(*self.values)
 
     def decode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, data: bytes
     ) -> None:
         """Decode response."""
-        self.values = list(
-            struct.unpack(
-                self.format,
-                data[0 : struct.calcsize(self.format)],
-            )
-        )
-        self._maybe_init_from_values()
+        self.values = MOTOR_COMMAND_STREAM_RESPONSE_STRUCT.unpack_from(data)
+        self._init_result_from_values()
 
 
 class MotorCommandStreamRequest(ModbusRequest):
@@ -97,20 +97,38 @@ class MotorCommandStreamRequest(ModbusRequest):
     # | CRC      | 2      | CRC-16 (Modbus) Polynomial 0xA001                |
     # |          | bytes  |                                                  |
     # +----------+--------+--------------------------------------------------+
-    _rtu_frame_size: int = (
-        struct.calcsize(MOTOR_COMMAND_STREAM_REQUEST_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MOTOR_COMMAND_STREAM_REQUEST_STRUCT.size + FRAMER_BYTES
 
     def __init__(self, sub_function_code: int, data: int, **kwargs):
         super().__init__(**kwargs)
-        self.format: str = MOTOR_COMMAND_STREAM_REQUEST_FORMAT
         self.sub_function_code: int = sub_function_code
         self.data: int = data
 
+    @classmethod
+    def force(cls, force_mN: int, **kwargs) -> "MotorCommandStreamRequest":
+        """Creates a force control stream request."""
+        return cls(FORCE_CONTROL_SUB_FUNCTION_CODE, force_mN & 0xFFFFFFFF, **kwargs)
+
+    @classmethod
+    def position(cls, position_um: int, **kwargs) -> "MotorCommandStreamRequest":
+        """Creates a position control stream request."""
+        return cls(
+            POSITION_CONTROL_SUB_FUNCTION_CODE, position_um & 0xFFFFFFFF, **kwargs
+        )
+
+    @classmethod
+    def kinematic(cls, **kwargs) -> "MotorCommandStreamRequest":
+        """Creates a kinematic data stream request."""
+        return cls(KINEMATIC_DATA_SUB_FUNCTION_CODE, 0, **kwargs)
+
+    @classmethod
+    def haptic(cls, haptic_status: int, **kwargs) -> "MotorCommandStreamRequest":
+        """Creates a haptic data stream request."""
+        return cls(HAPTIC_DATA_SUB_FUNCTION_CODE, haptic_status, **kwargs)
+
     def encode(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
         """Encode request."""
-        return struct.pack(
-            self.format,
+        return MOTOR_COMMAND_STREAM_REQUEST_STRUCT.pack(
             self.sub_function_code,
             self.data,
         )
@@ -119,9 +137,8 @@ class MotorCommandStreamRequest(ModbusRequest):
         self, data: bytes
     ) -> None:
         """Decode request."""
-        self.sub_function_code, self.data = struct.unpack(
-            self.format,
-            data,
+        self.sub_function_code, self.data = (
+            MOTOR_COMMAND_STREAM_REQUEST_STRUCT.unpack_from(data)
         )
 
     def execute(self, context) -> MotorCommandStreamResponse:
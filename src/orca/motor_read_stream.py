@@ -1,6 +1,7 @@
+import functools
 import struct
 from dataclasses import dataclass
-from typing import Union
+from typing import Sequence, Union
 
 from pymodbus.pdu import ModbusRequest, ModbusResponse
 
@@ -9,9 +10,28 @@ MOTOR_READ_STREAM_FUNCTION_CODE: int = 104
 MOTOR_READ_STREAM_RESPONSE_FORMAT: str = ">IBiiHBHH"
 MOTOR_READ_STREAM_REQUEST_FORMAT: str = ">HB"
 MOTOR_READ_STREAM_RESPONSE_NUM_EXPECTED_VALUES: int = 8
+# Compiled once so encoding and decoding skip parsing the format strings.
+MOTOR_READ_STREAM_RESPONSE_STRUCT: struct.Struct = struct.Struct(
+    MOTOR_READ_STREAM_RESPONSE_FORMAT
+)
+MOTOR_READ_STREAM_REQUEST_STRUCT: struct.Struct = struct.Struct(
+    MOTOR_READ_STREAM_REQUEST_FORMAT
+)
 
 
-@dataclass(kw_only=True)
+@functools.lru_cache(maxsize=32)
+def _encode_request(register_address: int, register_width: int) -> bytes:
+    """
+    Packs a motor read stream request payload.
+
+    Requests are polled with a handful of fixed (address, width) pairs, so
+    the packed bytes are cached rather than rebuilt on every call. The
+    framer appends the device address and CRC.
+    """
+    return MOTOR_READ_STREAM_REQUEST_STRUCT.pack(register_address, register_width)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
 class MotorReadStreamResult:
     register_value: int
     mode: int
@@ -25,53 +45,42 @@ class MotorReadStreamResult:
 
 class MotorReadStreamResponse(ModbusResponse):
     function_code: int = MOTOR_READ_STREAM_FUNCTION_CODE
-    _rtu_frame_size: int = (
-        struct.calcsize(MOTOR_READ_STREAM_RESPONSE_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MOTOR_READ_STREAM_RESPONSE_STRUCT.size + FRAMER_BYTES
 
-    def __init__(self, values: Union[list, None] = None, **kwargs):
+    def __init__(self, values: Union[Sequence[int], None] = None, **kwargs):
         """Initialize response."""
         ModbusResponse.__init__(self, **kwargs)
-        self.format: str = MOTOR_READ_STREAM_RESPONSE_FORMAT
-        self.values: list = values or []
+        self.values: Sequence[int] = values or ()
         self.result: Union[MotorReadStreamResult, None] = None
-        self._maybe_init_from_values()
+        if self.values:
+            self._init_result_from_values()
 
-    def _maybe_init_from_values(self):
+    def _init_result_from_values(self):
         """Initialize member variables from values."""
-        if self.values:
-            self.result = MotorReadStreamResult(
-                register_value=self.values[0],
-                mode=self.values[1],
-                position_um=self.values[2],
-                force_mN=self.values[3],
-                power_W=self.values[4],
-                temperature_C=self.values[5],
-                voltage_mV=self.values[6],
-                errors=self.values[7],
-            )
+        self.result = MotorReadStreamResult(
+            register_value=self.values[0],
+            mode=self.values[1],
+            position_um=self.values[2],
+            force_mN=self.values[3],
+            power_W=self.values[4],
+            temperature_C=self.values[5],
+            voltage_mV=self.values[6],
+            errors=self.values[7],
+        )
 
     def encode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self,
     ) -> Union[bytes, None]:
         """Encode response."""
         if self.values:
-            return struct.pack(
-                self.format,
-                *self.values,
-            )
+            return MOTOR_READ_STREAM_RESPONSE_STRUCT.pack(*self.values)
 
     def decode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, data: bytes
     ) -> None:
         """Decode response."""
-        self.values = list(
-            struct.unpack(
-                self.format,
-                data[0 : struct.calcsize(self.format)],
-            )
-        )
-        self._maybe_init_from_values()
+        self.values = MOTOR_READ_STREAM_RESPONSE_STRUCT.unpack_from(data)
+        self._init_result_from_values()
 
 
 class MotorReadStreamRequest(ModbusRequest):
@@ -90,31 +99,23 @@ class MotorReadStreamRequest(ModbusRequest):
     # +------------------+----------+------------------------------------------------+
     # | CRC              | 2 bytes  | CRC-16 (Modbus) Polynomial 0xA001              |
     # +------------------+----------+------------------------------------------------+
-    _rtu_frame_size: int = (
-        struct.calcsize(MOTOR_READ_STREAM_REQUEST_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MOTOR_READ_STREAM_REQUEST_STRUCT.size + FRAMER_BYTES
 
     def __init__(self, register_address: int, register_width: int, **kwargs):
         super().__init__(**kwargs)
-        self.format: str = MOTOR_READ_STREAM_REQUEST_FORMAT
         self.register_address: int = register_address
         self.register_width: int = register_width
 
     def encode(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
         """Encode request."""
-        return struct.pack(
-            self.format,
-            self.register_address,
-            self.register_width,
-        )
+        return _encode_request(self.register_address, self.register_width)
 
     def decode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, data: bytes
     ) -> None:
         """Decode request."""
-        self.register_address, self.register_width = struct.unpack(
-            self.format,
-            data,
+        self.register_address, self.register_width = (
+            MOTOR_READ_STREAM_REQUEST_STRUCT.unpack_from(data)
         )
 
     def execute(self, context) -> MotorReadStreamResponse:
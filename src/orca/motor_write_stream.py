@@ -1,6 +1,6 @@
 import struct
 from dataclasses import dataclass
-from typing import Union
+from typing import Sequence, Union
 
 from pymodbus.pdu import ModbusRequest, ModbusResponse
 
@@ -9,9 +9,16 @@ MOTOR_WRITE_STREAM_FUNCTION_CODE: int = 105
 MOTOR_WRITE_STREAM_RESPONSE_FORMAT: str = ">BiiHBHH"
 MOTOR_WRITE_STREAM_REQUEST_FORMAT: str = ">HBI"
 MOTOR_WRITE_STREAM_RESPONSE_NUM_EXPECTED_VALUES: int = 7
+# Compiled once so encoding and decoding skip parsing the format strings.
+MOTOR_WRITE_STREAM_RESPONSE_STRUCT: struct.Struct = struct.Struct(
+    MOTOR_WRITE_STREAM_RESPONSE_FORMAT
+)
+MOTOR_WRITE_STREAM_REQUEST_STRUCT: struct.Struct = struct.Struct(
+    MOTOR_WRITE_STREAM_REQUEST_FORMAT
+)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True, frozen=True)
 class MotorWriteStreamResult:
     mode: int
     position_um: int
@@ -24,52 +31,41 @@ class MotorWriteStreamResult:
 
 class MotorWriteStreamResponse(ModbusResponse):
     function_code: int = MOTOR_WRITE_STREAM_FUNCTION_CODE
-    _rtu_frame_size: int = (
-        struct.calcsize(MOTOR_WRITE_STREAM_RESPONSE_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MOTOR_WRITE_STREAM_RESPONSE_STRUCT.size + FRAMER_BYTES
 
-    def __init__(self, values: Union[list, None] = None, **kwargs):
+    def __init__(self, values: Union[Sequence[int], None] = None, **kwargs):
         """Initialize response."""
         ModbusResponse.__init__(self, **kwargs)
-        self.format: str = MOTOR_WRITE_STREAM_RESPONSE_FORMAT
-        self.values: list = values or []
+        self.values: Sequence[int] = values or ()
         self.result: Union[MotorWriteStreamResult, None] = None
-        self._maybe_init_from_values()
+        if self.values:
+            self._init_result_from_values()
 
-    def _maybe_init_from_values(self):
+    def _init_result_from_values(self):
         """Initialize member variables from supplied values."""
-        if self.values:
-            self.result = MotorWriteStreamResult(
-                mode=self.values[1],
-                position_um=self.values[2],
-                force_mN=self.values[3],
-                power_W=self.values[4],
-                temperature_C=self.values[5],
-                voltage_mV=self.values[6],
-                errors=self.values[7],
-            )
+        self.result = MotorWriteStreamResult(
+            mode=self.values[0],
+            position_um=self.values[1],
+            force_mN=self.values[2],
+            power_W=self.values[3],
+            temperature_C=self.values[4],
+            voltage_mV=self.values[5],
+            errors=self.values[6],
+        )
 
     def encode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self,
     ) -> Union[bytes, None]:
         """Encode response."""
         if self.values:
-            return struct.pack(
-                self.format,
-                *self.values,
-            )
+            return MOTOR_WRITE_STREAM_RESPONSE_STRUCT.pack(*self.values)
 
     def decode(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, data: bytes
     ) -> None:
         """Decode response."""
-        self.values = list(
-            struct.unpack(
-                self.format,
-                data[0 : struct.calcsize(self.format)],
-            )
-        )
-        self._maybe_init_from_values()
+        self.values = MOTOR_WRITE_STREAM_RESPONSE_STRUCT.unpack_from(data)
+        self._init_result_from_values()
 
 
 class MotorWriteStreamRequest(ModbusRequest):
@@ -90,21 +86,17 @@ class MotorWriteStreamRequest(ModbusRequest):
     # +------------------+---------+--------------------------------------------------------+
     # | CRC              | 2 bytes | CRC-16 (Modbus) Polynomial 0xA001                      |
     # +------------------+---------+--------------------------------------------------------+
-    _rtu_frame_size: int = (
-        struct.calcsize(MOTOR_WRITE_STREAM_REQUEST_FORMAT) + FRAMER_BYTES
-    )
+    _rtu_frame_size: int = MOTOR_WRITE_STREAM_REQUEST_STRUCT.size + FRAMER_BYTES
 
     def __init__(self, register_address: int, register_width: int, data: int, **kwargs):
         super().__init__(**kwargs)
-        self.format: str = MOTOR_WRITE_STREAM_REQUEST_FORMAT
         self.register_address: int = register_address
         self.register_width: int = register_width
         self.data: int = data
 
     def encode(self) -> bytes:  # pyright: ignore[reportIncompatibleMethodOverride]
         """Encode request."""
-        return struct.pack(
-            self.format,
+        return MOTOR_WRITE_STREAM_REQUEST_STRUCT.pack(
             self.register_address,
             self.register_width,
             self.data,
@@ -114,9 +106,8 @@ class MotorWriteStreamRequest(ModbusRequest):
         self, data: bytes
     ) -> None:
         """Decode request."""
-        self.register_address, self.register_width, self.data = struct.unpack(
-            self.format,
-            data,
+        self.register_address, self.register_width, self.data = (
+            MOTOR_WRITE_STREAM_REQUEST_STRUCT.unpack_from(data)
         )
 
     def execute(self, context) -> MotorWriteStreamResponse: